@@ -1,5 +1,5 @@
 """Integrations module for external services."""
 
-from .fibonrose import send_score
+from .fibonrose import send_score, send_scores_batch
 
-__all__ = ["send_score"]
+__all__ = ["send_score", "send_scores_batch"]
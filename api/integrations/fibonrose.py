@@ -1,37 +1,96 @@
 """Fibonrose integration for score reporting."""
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import logging
+import os
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
+# Fibonrose score endpoints; when unset, scores are only logged
+FIBONROSE_ENDPOINT = os.getenv("FIBONROSE_ENDPOINT")
+FIBONROSE_BATCH_ENDPOINT = os.getenv("FIBONROSE_BATCH_ENDPOINT")
+
 
 async def send_score(
-    url: str, 
-    score: int, 
+    url: str,
+    score: int,
     asl_compatible: bool,
-    endpoint: Optional[str] = None
+    endpoint: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
 ) -> dict:
     """
     Send accessibility score to Fibonrose dashboard.
-    
+
     Args:
         url: URL that was validated
         score: Deaf accessibility score (0-100)
         asl_compatible: Whether URL is ASL compatible
-        endpoint: Optional Fibonrose endpoint URL
-        
+        endpoint: Optional Fibonrose endpoint URL (defaults to FIBONROSE_ENDPOINT)
+        client: Shared HTTP client; reusing one keeps connections to Fibonrose alive
+
     Returns:
         Response from Fibonrose API
     """
-    # In production, this would send to actual Fibonrose endpoint
-    # For now, we log and return success
-    logger.info(f"Sending score to Fibonrose: url={url}, score={score}, asl={asl_compatible}")
-    
-    return {
-        "status": "success",
+    payload = {
         "url": url,
         "score": score,
-        "asl_compatible": asl_compatible,
-        "recorded": True
+        "asl_compatible": asl_compatible
     }
+    endpoint = endpoint or FIBONROSE_ENDPOINT
+
+    if endpoint is None or client is None:
+        # No Fibonrose endpoint configured - log and return success
+        logger.info("Sending score to Fibonrose: url=%s, score=%s, asl=%s", url, score, asl_compatible)
+        return {"status": "success", **payload, "recorded": True}
+
+    try:
+        response = await client.post(endpoint, json=payload)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning("Failed to send score to Fibonrose for %s: %s", url, e)
+        return {"status": "error", **payload, "recorded": False}
+
+    # A 2xx may carry an empty or non-JSON body (e.g. 204); the scores are recorded either way
+    try:
+        return response.json()
+    except ValueError:
+        return {"status": "success", **payload, "recorded": True}
+
+
+async def send_scores_batch(
+    scores: List[Dict[str, Any]],
+    endpoint: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> dict:
+    """
+    Send several accessibility scores to Fibonrose in a single request.
+
+    Args:
+        scores: Score payloads, each with url, score and asl_compatible
+        endpoint: Optional Fibonrose batch endpoint URL (defaults to FIBONROSE_BATCH_ENDPOINT)
+        client: Shared HTTP client; reusing one keeps connections to Fibonrose alive
+
+    Returns:
+        Response from Fibonrose API
+    """
+    endpoint = endpoint or FIBONROSE_BATCH_ENDPOINT
+
+    if endpoint is None or client is None:
+        # No Fibonrose endpoint configured - log and return success
+        logger.info("Sending %d scores to Fibonrose", len(scores))
+        return {"status": "success", "count": len(scores), "recorded": True}
+
+    try:
+        response = await client.post(endpoint, json={"scores": scores})
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning("Failed to send %d scores to Fibonrose: %s", len(scores), e)
+        return {"status": "error", "count": len(scores), "recorded": False}
+
+    # A 2xx may carry an empty or non-JSON body (e.g. 204); the scores are recorded either way
+    try:
+        return response.json()
+    except ValueError:
+        return {"status": "success", "count": len(scores), "recorded": True}
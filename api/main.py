@@ -7,15 +7,30 @@ An accessibility broker that owns declarations, discovery, validation signals, a
 Everything else is downstream.
 """
 
-from fastapi import FastAPI, HTTPException, Header, Query
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Header, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from contextlib import asynccontextmanager
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator, Awaitable, Callable, Iterable, Type, TypeVar, Union
+import asyncio
+import bisect
+import gc
+import json
 import logging
-from datetime import datetime
-import uuid
-import uuid
+import os
+import time
+import httpx
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from datetime import datetime, timezone
+import base64
 import hashlib
-from datetime import datetime
 
 from .models.user import UserProfile, UserExperience
 from .models.services import (
@@ -35,8 +50,9 @@ from .schemas import (
     DiscrepancyReport,
     FalsePositiveReport,
     UserMismatchReport,
-    ComplianceResult,
-    ValidationTarget,
+    ComplianceResultOut,
+    ValidationReportOut,
+    ValidationTargetOut,
     ProviderInfo,
     SpecVersion
 )
@@ -44,23 +60,110 @@ from .schemas.accessibility import ContextConstraints
 from .schemas.capabilities import CapabilityDeclaration
 from .schemas.events import EventType
 from .models.broker import (
-    AccessibilityEvent,
-    EventResponse,
+    AccessibilityEvent as BrokerAccessibilityEvent,
+    EventResponse as BrokerEventResponse,
     AppCapability,
     CapabilitiesResponse,
     SubscriptionRequest,
     SubscriptionResponse,
-    ComplianceReport,
-    ComplianceViolation
+    ComplianceReport
 )
 from .services import PinkSyncServices, discover_services, SERVICE_DISCOVERY_MAP
 from .validators import validate_url
-from .integrations.fibonrose import send_score
+from .integrations.fibonrose import send_scores_batch
+from .responses import ORJSONResponse
+from .store import EventLog
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    loop = asyncio.get_running_loop()
+    logger.info("Starting on event loop %s.%s", type(loop).__module__, type(loop).__name__)
+    
+    # One pooled client for outbound calls (Fibonrose) so connections are reused;
+    # failed connection attempts (not sent requests) are retried twice
+    app.state.http = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+            retries=2
+        ),
+        timeout=10.0
+    )
+    
+    # Everything allocated so far (framework, catalogs, indexes) lives for the
+    # whole process; move it out of the collector's view and collect young
+    # objects less often, since handlers allocate in short bursts
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(50_000, 10, 10)
+    
+    # Accepted events are persisted off the request path
+    app.state.event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAX_SIZE)
+    event_writer = asyncio.create_task(_event_writer(app.state.event_queue))
+    try:
+        yield
+    finally:
+        event_writer.cancel()
+        _drain_event_queue(app.state.event_queue)
+        del app.state.event_queue
+        await app.state.http.aclose()
+        # The GC freeze and thresholds set above are deliberately left in
+        # place: they are process-wide and the process exits after shutdown
+
+
+# OpenAPI tags metadata
+tags_metadata = [
+    {
+        "name": "Accessibility Context",
+        "description": "Initialize accessibility contexts - handshake between app capabilities and user preferences"
+    },
+    {
+        "name": "Capability Registry",
+        "description": "Discover accessibility capabilities and providers. Query which providers support specific features."
+    },
+    {
+        "name": "Broker v1",
+        "description": "PinkSync Accessibility Event Broker - Core API for accessibility intent brokering. Contract-first, type-safe, async-native. See specs/event-broker.contract.md for full contract."
+    },
+    {
+        "name": "Ecosystem",
+        "description": "Discover features, tools, and microservices from github.com/pinkycollie/pinksync source repository"
+    },
+    {
+        "name": "Dashboard",
+        "description": "Initialize personalized Deaf-First dashboard"
+    },
+    {
+        "name": "Validation & Compliance",
+        "description": "Machine-readable compliance validation. Results can block deployments, unlock badges, or satisfy regulators."
+    },
+    {
+        "name": "Accessibility Events",
+        "description": "Real-time event stream. Append-only, structured, auditable. The heart of PinkSync."
+    },
+    {
+        "name": "Signal Correction",
+        "description": "Report discrepancies, false positives, and mismatches. Signal correction, not opinions."
+    },
+    {
+        "name": "Legacy",
+        "description": "Legacy endpoints for backward compatibility. Use versioned /v1 endpoints instead."
+    },
+    {
+        "name": "Health",
+        "description": "Health check and status endpoints"
+    },
+    {
+        "name": "Root",
+        "description": "Root endpoints and API information"
+    }
+]
+
 # Initialize FastAPI app
 app = FastAPI(
     title="PinkSync API - Accessibility Signal Exchange",
@@ -139,7 +242,10 @@ app = FastAPI(
     """,
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    openapi_tags=tags_metadata,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -151,22 +257,312 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (catalogs, batch reports, endpoint listings)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Initialize services
 pinksync_services = PinkSyncServices()
 
 # In-memory storage for broker (would be replaced with database in production)
-events_store = []
-capabilities_store = []
+events_store = EventLog()
+capabilities_store: List[AppCapability] = []
 subscriptions_store = []
-compliance_store = {}
+subscriptions_by_consumer: Dict[str, str] = {}
+
+# Compliance tracking per app: event counts, current level, last event time (epoch ns)
+compliance_event_counts: Counter = Counter()
+compliance_levels: Dict[str, str] = {}
+compliance_last_event_ns: Dict[str, int] = {}
+
+# Compliance level by event count; an app's level changes only when its count
+# reaches one of these thresholds
+_COMPLIANCE_LEVEL_THRESHOLDS = {1: "bronze", 10: "bronze", 50: "silver", 200: "gold"}
+
+# Upper bound on concurrent per-target work fanned out by batch endpoints
+MAX_CONCURRENT_VALIDATIONS = 32
+
+# Response timestamps are reformatted at most once per this many nanoseconds
+# (default 1ms); set to 1000 for exact microsecond timestamps
+TIMESTAMP_RESOLUTION_NS = max(1_000, int(os.getenv("PINKSYNC_TIMESTAMP_RESOLUTION_NS", "1000000")))
+# Print only the fractional digits that resolution actually carries
+_TIMESTAMP_TIMESPEC = "milliseconds" if TIMESTAMP_RESOLUTION_NS % 1_000_000 == 0 else "microseconds"
+
+# Event signatures are keyed BLAKE2b; the key is absorbed once here and each
+# signature starts from a copy of that state
+_signing_key = os.getenv("PINKSYNC_SIGNING_KEY", "").encode()
+if not _signing_key:
+    logger.warning("PINKSYNC_SIGNING_KEY is not set; event signatures are unkeyed and anyone can recompute them")
+elif len(_signing_key) > 64:
+    # BLAKE2b keys are at most 64 bytes, so longer secrets are hashed down to 64
+    _signing_key = hashlib.blake2b(_signing_key).digest()
+_EVENT_SIGNER = hashlib.blake2b(key=_signing_key, digest_size=32)
+del _signing_key
+
+T = TypeVar("T")
+
+# Dedicated workers for URL validation so it never blocks the event loop
+# and does not compete with FastAPI's threadpool for sync endpoints
+_validator_pool = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="validator"
+)
+
+
+# Recent validate_url results by normalized URL (with the monotonic time they
+# expire), plus validations still running so concurrent requests for the same
+# URL share one check
+VALIDATION_CACHE_SIZE = 8192
+VALIDATION_CACHE_TTL_S = float(os.getenv("PINKSYNC_VALIDATION_CACHE_TTL_S", "3600"))
+_validation_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_validations_in_flight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Canonical form of an http(s) URL for cache keys: lowercase scheme/host, and no
+    trailing slash when the URL has no query or fragment.
+    
+    Only differences validate_url is insensitive to are folded together. URLs
+    that urlsplit would alter on its own (stripped tabs/newlines, dropped empty
+    query or fragment) or that contain non-ASCII are returned unchanged, so
+    they get a cache entry of their own.
+    """
+    if not url.isascii():
+        return url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return url
+    # urlsplit lowercases the scheme itself; anything else it changed is left alone
+    if urlunsplit(parts) != parts.scheme + url[len(parts.scheme):]:
+        return url
+    # A trailing slash only folds away when nothing follows the path:
+    # validate_url needs "/" or "?" after the host, so "host/#x" is valid
+    # but "host#x" is not
+    path = parts.path
+    if not parts.query and not parts.fragment:
+        path = path.rstrip("/")
+    return urlunsplit((
+        parts.scheme,
+        parts.netloc.lower(),
+        path,
+        parts.query,
+        parts.fragment
+    ))
+
+
+async def _validate_url_async(url: str) -> Dict[str, Any]:
+    """Run validate_url on the validator pool, reusing results for equivalent URLs."""
+    key = _normalize_url(url)
+    cached = _validation_cache.get(key)
+    if cached is not None:
+        expires_at, result = cached
+        if time.monotonic() < expires_at:
+            _validation_cache.move_to_end(key)
+            return {**result, "url": url}
+        del _validation_cache[key]
+    
+    future = _validations_in_flight.get(key)
+    if future is not None:
+        result = await asyncio.shield(future)
+        return {**result, "url": url}
+    
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_validator_pool, validate_url, url)
+    _validations_in_flight[key] = future
+    try:
+        result = await asyncio.shield(future)
+    finally:
+        del _validations_in_flight[key]
+    
+    _validation_cache[key] = (time.monotonic() + VALIDATION_CACHE_TTL_S, result)
+    if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+        _validation_cache.popitem(last=False)
+    return {**result, "url": url}
+
+
+_cached_timestamp: Tuple[int, str] = (-1, "")
+
+
+def _new_id() -> str:
+    """Random 128-bit identifier as 22 URL-safe base64 characters."""
+    return base64.urlsafe_b64encode(os.urandom(16)).rstrip(b"=").decode("ascii")
+
+
+def _short_hex_id() -> str:
+    """Random 48-bit identifier as 12 hex characters, for prefixed IDs."""
+    return os.urandom(6).hex()
+
+
+def _short_hex_ids(count: int) -> List[str]:
+    """`count` short hex identifiers drawn from a single urandom read."""
+    text = os.urandom(6 * count).hex()
+    return [text[i:i + 12] for i in range(0, 12 * count, 12)]
+
+
+def _naive_utc_from_ns(timestamp_ns: int) -> datetime:
+    """Naive UTC datetime (as datetime.utcnow() returns) for an epoch-nanosecond timestamp."""
+    return datetime.fromtimestamp(timestamp_ns // 1_000_000_000, timezone.utc).replace(
+        microsecond=(timestamp_ns // 1_000) % 1_000_000,
+        tzinfo=None
+    )
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a "Z" suffix, cached per resolution tick."""
+    global _cached_timestamp
+    tick = time.time_ns() // TIMESTAMP_RESOLUTION_NS
+    cached_tick, text = _cached_timestamp
+    if tick != cached_tick:
+        now_ns = tick * TIMESTAMP_RESOLUTION_NS
+        moment = datetime.fromtimestamp(now_ns // 1_000_000_000, timezone.utc).replace(
+            microsecond=(now_ns // 1_000) % 1_000_000
+        )
+        text = moment.isoformat(timespec=_TIMESTAMP_TIMESPEC).replace("+00:00", "Z")
+        _cached_timestamp = (tick, text)
+    return text
+
+
+async def _gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int = MAX_CONCURRENT_VALIDATIONS
+) -> List[T]:
+    """Await all awaitables concurrently, at most `limit` at a time, preserving order."""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(_run(aw) for aw in aws))
+
+
+# Most queued events the writer persists per wake-up
+EVENT_WRITE_BATCH_SIZE = 256
+
+# Most accepted events held for the writer before requests persist inline
+EVENT_QUEUE_MAX_SIZE = 10_000
+
+
+def _persist_event(event_id: str, event: BrokerAccessibilityEvent, processed_at_ns: int, signature: str) -> None:
+    """Append an accepted event to the event log."""
+    events_store.append(event_id, event, processed_at_ns, signature)
+    logger.info("Event accepted: %s from %s with intent %s", event_id, event.app_id, event.intent)
+
+
+def _drain_event_queue(queue: asyncio.Queue, limit: Optional[int] = None) -> int:
+    """Persist queued events without waiting, up to `limit`; returns how many were written."""
+    written = 0
+    while not queue.empty() and (limit is None or written < limit):
+        _persist_event(*queue.get_nowait())
+        written += 1
+    return written
+
+
+async def _event_writer(queue: asyncio.Queue) -> None:
+    """Background task persisting accepted events in batches as they arrive."""
+    while True:
+        _persist_event(*await queue.get())
+        _drain_event_queue(queue, EVENT_WRITE_BATCH_SIZE - 1)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+async def _parse_json_body(request: Request, model: Type[ModelT]) -> ModelT:
+    """
+    Validate the raw request body against `model` in a single pydantic-core pass.
+    
+    Skips FastAPI's json.loads-then-validate body handling. Empty and malformed
+    bodies get the same 422 errors FastAPI reports. Field errors come from
+    pydantic's JSON mode, so their types can differ from FastAPI's: a JSON
+    array body reports `model_type` rather than `model_attributes_type`.
+    """
+    body = await request.body()
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ]
+    
+    # Not JSON at all: rebuild FastAPI's errors, which carry json.loads' position and message
+    if errors[0]["type"] == "json_invalid":
+        if not body:
+            errors = [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        else:
+            try:
+                json.loads(body)
+            except json.JSONDecodeError as e:
+                errors = [{
+                    "type": "json_invalid",
+                    "loc": ("body", e.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": e.msg}
+                }]
+            except ValueError:
+                # Undecodable bytes; FastAPI answers these with a 400 as well
+                raise HTTPException(status_code=400, detail="There was an error parsing the body")
+    raise RequestValidationError(errors)
+
+
+def _query_parameters_schema(**descriptions: str) -> Dict[str, Any]:
+    """OpenAPI parameters for optional string query filters read from request.query_params."""
+    return {
+        "parameters": [
+            {
+                "name": name,
+                "in": "query",
+                "required": False,
+                "schema": {"type": "string"},
+                "description": description
+            }
+            for name, description in descriptions.items()
+        ]
+    }
+
+
+def _inline_schema_refs(node: Any, defs: Dict[str, Any]) -> Any:
+    """Replace local `#/$defs/...` references with the (non-recursive) definitions they name."""
+    if isinstance(node, dict):
+        ref = node.get("$ref", "")
+        if ref.startswith("#/$defs/"):
+            return _inline_schema_refs(defs[ref.removeprefix("#/$defs/")], defs)
+        return {key: _inline_schema_refs(value, defs) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_inline_schema_refs(item, defs) for item in node]
+    return node
+
+
+def _json_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI requestBody for endpoints that parse their body with _parse_json_body."""
+    # Nested models are inlined: "#/$defs/..." would not resolve inside the OpenAPI document
+    schema = model.model_json_schema()
+    schema = _inline_schema_refs(schema, schema.pop("$defs", {}))
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}}
+        }
+    }
 
 
 # ============================================================================
 # PinkSync Broker API v1 - Accessibility Event Brokering
 # ============================================================================
 
-@app.post("/v1/events", response_model=EventResponse, status_code=201, tags=["Broker v1"])
-async def accept_event(event: AccessibilityEvent):
+@app.post(
+    "/v1/events",
+    responses={201: {"model": BrokerEventResponse}},
+    status_code=201,
+    tags=["Broker v1"],
+    openapi_extra=_json_body_schema(BrokerAccessibilityEvent)
+)
+async def accept_event(request: Request):
     """
     Accept accessibility events from applications.
     
@@ -178,74 +574,131 @@ async def accept_event(event: AccessibilityEvent):
     
     Returns a signed response with event ID for verification and audit purposes.
     """
+    event = await _parse_json_body(request, BrokerAccessibilityEvent)
+    
     # Generate unique event ID
-    event_id = str(uuid.uuid4())
+    event_id = _new_id()
     
     # Create signature (simplified - in production use proper cryptographic signing)
-    signature_data = f"{event_id}:{event.app_id}:{event.intent}:{event.timestamp}"
-    signature = hashlib.sha256(signature_data.encode()).hexdigest()
-    
-    # Store event (in production, this would go to a database and message queue)
-    event_record = {
-        "event_id": event_id,
-        "event": event.model_dump(),
-        "processed_at": datetime.utcnow(),
-        "signature": signature
-    }
-    events_store.append(event_record)
+    signer = _EVENT_SIGNER.copy()
+    signer.update(f"{event_id}:{event.app_id}:{event.intent}:{event.timestamp}".encode())
+    signature = signer.hexdigest()
     
     # Update compliance tracking
-    if event.app_id not in compliance_store:
-        compliance_store[event.app_id] = {
-            "events_count": 0,
-            "violations": [],
-            "last_event": None
-        }
-    compliance_store[event.app_id]["events_count"] += 1
-    compliance_store[event.app_id]["last_event"] = datetime.utcnow()
+    processed_at_ns = time.time_ns()
+    compliance_event_counts[event.app_id] += 1
+    compliance_last_event_ns[event.app_id] = processed_at_ns
+    level = _COMPLIANCE_LEVEL_THRESHOLDS.get(compliance_event_counts[event.app_id])
+    if level:
+        compliance_levels[event.app_id] = level
     
-    logger.info(f"Event accepted: {event_id} from {event.app_id} with intent {event.intent}")
-    
-    return EventResponse(
+    # Store event (in production, this would go to a database and message queue)
+    event_queue = getattr(app.state, "event_queue", None)
+    if event_queue is not None and not event_queue.full():
+        event_queue.put_nowait((event_id, event, processed_at_ns, signature))
+    else:
+        # Writer is behind (or not running): flush the backlog first so the
+        # log keeps acceptance order, then persist this event inline
+        if event_queue is not None:
+            _drain_event_queue(event_queue)
+        _persist_event(event_id, event, processed_at_ns, signature)
+    
+    # Server-built response, so skip re-validation and encode it directly
+    response = BrokerEventResponse.model_construct(
         event_id=event_id,
         status="accepted",
-        timestamp=datetime.utcnow(),
+        timestamp=_naive_utc_from_ns(processed_at_ns),
         signature=signature,
         ledger_id=None  # Would be set if using blockchain/ledger
     )
+    return ORJSONResponse(response.model_dump(), status_code=201)
 
 
-@app.get("/v1/capabilities", response_model=CapabilitiesResponse, tags=["Broker v1"])
-async def list_capabilities(
-    app_id: Optional[str] = Query(None, description="Filter by specific application"),
-    compliance_level: Optional[str] = Query(None, description="Filter by compliance level"),
-    intent: Optional[str] = Query(None, description="Filter by supported intent")
-):
+# Body for capability queries that match nothing
+_NO_CAPABILITIES_BODY = orjson.dumps({"capabilities": [], "total": 0})
+
+# Serializes registrations straight to JSON bytes, without per-model dicts
+_CAPABILITY_LIST_ADAPTER = TypeAdapter(List[AppCapability])
+
+
+# Query parameters that select the capability registry form of GET /v1/capabilities,
+# and the broker list filters they cannot be combined with
+_REGISTRY_QUERY_PARAMETERS = ("capability_type", "provider_type", "spec_version")
+_BROKER_QUERY_PARAMETERS = ("app_id", "compliance_level", "intent")
+
+
+@app.get(
+    "/v1/capabilities",
+    responses={200: {"model": Union[CapabilitiesResponse, CapabilityResponse]}},
+    tags=["Broker v1", "Capability Registry"],
+    openapi_extra=_query_parameters_schema(
+        app_id="Filter by specific application",
+        compliance_level="Filter by compliance level",
+        intent="Filter by supported intent",
+        capability_type="Registry query: filter capabilities by type (visual, audio, text, ...)",
+        provider_type="Registry query: filter providers by type (service, app, platform)",
+        spec_version="Registry query: minimum spec version providers comply with"
+    )
+)
+async def list_capabilities(request: Request):
     """
     List all registered application capabilities.
     
     Returns capabilities declared by applications, filterable by various criteria.
     
+    Passing any registry filter (`capability_type`, `provider_type`,
+    `spec_version`) queries the capability registry instead; see
+    `query_capabilities` for that response shape. Registry filters cannot be
+    combined with `app_id`, `compliance_level` or `intent` (400).
+    
     **Contract:** Defined in specs/event-broker.contract.md
     """
-    filtered_capabilities = capabilities_store.copy()
-    
-    # Apply filters
-    if app_id:
-        filtered_capabilities = [c for c in filtered_capabilities if c.app_id == app_id]
-    if compliance_level:
-        filtered_capabilities = [c for c in filtered_capabilities if c.compliance_level == compliance_level]
-    if intent:
-        filtered_capabilities = [c for c in filtered_capabilities if intent in c.capabilities]
-    
-    return CapabilitiesResponse(
-        capabilities=filtered_capabilities,
-        total=len(filtered_capabilities)
+    # Plain string filters, read directly rather than through per-parameter validation
+    query_params = request.query_params
+    if any(name in query_params for name in _REGISTRY_QUERY_PARAMETERS):
+        if any(name in query_params for name in _BROKER_QUERY_PARAMETERS):
+            raise HTTPException(
+                status_code=400,
+                detail="Registry filters (capability_type, provider_type, spec_version) "
+                       "cannot be combined with app_id, compliance_level or intent"
+            )
+        return await query_capabilities(
+            query_params.get("capability_type"),
+            query_params.get("provider_type"),
+            query_params.get("spec_version"),
+            request.headers.get("if-none-match")
+        )
+    
+    app_id = query_params.get("app_id")
+    compliance_level = query_params.get("compliance_level")
+    intent = query_params.get("intent")
+    
+    # Apply all filters in a single pass
+    filtered_capabilities = [
+        c for c in capabilities_store
+        if (not app_id or c.app_id == app_id)
+        and (not compliance_level or c.compliance_level == compliance_level)
+        and (not intent or intent in c.capabilities)
+    ]
+    if not filtered_capabilities:
+        return Response(content=_NO_CAPABILITIES_BODY, media_type="application/json")
+    
+    # Splice the adapter's output into the CapabilitiesResponse envelope
+    body = b'{"capabilities":%s,"total":%d}' % (
+        _CAPABILITY_LIST_ADAPTER.dump_json(filtered_capabilities),
+        len(filtered_capabilities)
     )
+    return Response(content=body, media_type="application/json")
 
 
-@app.post("/v1/subscribe", response_model=SubscriptionResponse, status_code=201, tags=["Broker v1"])
-async def create_subscription(subscription: SubscriptionRequest):
+@app.post(
+    "/v1/subscribe",
+    responses={201: {"model": SubscriptionResponse}},
+    status_code=201,
+    tags=["Broker v1"],
+    openapi_extra=_json_body_schema(SubscriptionRequest)
+)
+async def create_subscription(request: Request):
     """
     Subscribe to accessibility events.
     
@@ -254,37 +707,60 @@ async def create_subscription(subscription: SubscriptionRequest):
     
     **Contract:** Defined in specs/event-broker.contract.md
     """
+    subscription = await _parse_json_body(request, SubscriptionRequest)
+    
     # Check if subscription already exists
-    existing = [s for s in subscriptions_store if s["subscription"]["consumer_id"] == subscription.consumer_id]
-    if existing:
+    if subscription.consumer_id in subscriptions_by_consumer:
         raise HTTPException(
             status_code=409,
             detail=f"Subscription already exists for consumer_id: {subscription.consumer_id}"
         )
     
     # Generate subscription ID
-    subscription_id = str(uuid.uuid4())
+    subscription_id = _new_id()
+    created_at = datetime.utcnow()
     
     # Store subscription
     subscription_record = {
         "subscription_id": subscription_id,
-        "subscription": subscription.model_dump(),
-        "created_at": datetime.utcnow(),
+        "subscription": subscription,
+        "created_at": created_at,
         "status": "active"
     }
     subscriptions_store.append(subscription_record)
+    subscriptions_by_consumer[subscription.consumer_id] = subscription_id
     
-    logger.info(f"Subscription created: {subscription_id} for consumer {subscription.consumer_id}")
+    logger.info("Subscription created: %s for consumer %s", subscription_id, subscription.consumer_id)
     
-    return SubscriptionResponse(
+    response = SubscriptionResponse.model_construct(
         subscription_id=subscription_id,
         status="active",
-        created_at=datetime.utcnow(),
+        created_at=created_at,
         expires_at=None  # Could set expiration if needed
     )
+    return ORJSONResponse(response.model_dump(), status_code=201)
+
+
+@lru_cache(maxsize=4096)
+def _compliance_report_body(app_id: str, events_count: int) -> bytes:
+    """Build and encode an app's compliance report for the given event count."""
+    # The level is maintained as events arrive; no violation-ingest path exists
+    # yet, so every registered app reports compliant with no violations
+    level = compliance_levels[app_id]
+    
+    report = ComplianceReport.model_construct(
+        app_id=app_id,
+        compliance_level=level,
+        status="compliant",
+        last_audit=_naive_utc_from_ns(compliance_last_event_ns[app_id]),
+        events_count=events_count,
+        violations=[],
+        certificate_url=f"https://pinksync.org/certificates/{app_id}-{level}"
+    )
+    return orjson.dumps(report.model_dump(), option=orjson.OPT_UTC_Z)
 
 
-@app.get("/v1/compliance/{app_id}", response_model=ComplianceReport, tags=["Broker v1"])
+@app.get("/v1/compliance/{app_id}", responses={200: {"model": ComplianceReport}}, tags=["Broker v1"])
 async def get_compliance(
     app_id: str,
     detailed: bool = Query(False, description="Include detailed compliance report")
@@ -299,54 +775,16 @@ async def get_compliance(
     **Compliance Levels:** Defined in specs/compliance-levels.md
     """
     # Check if app exists in our records
-    if app_id not in compliance_store:
+    if app_id not in compliance_event_counts:
         raise HTTPException(
             status_code=404,
             detail=f"Application '{app_id}' not registered with PinkSync broker"
         )
     
-    # Get compliance data
-    app_compliance = compliance_store[app_id]
-    
-    # Determine compliance level based on events count (simplified logic)
-    events_count = app_compliance["events_count"]
-    if events_count >= 200:
-        level = "gold"
-    elif events_count >= 50:
-        level = "silver"
-    elif events_count >= 10:
-        level = "bronze"
-    else:
-        level = "bronze"
-    
-    # Determine status
-    violations = app_compliance["violations"]
-    critical_violations = [v for v in violations if v["severity"] == "critical"]
-    if critical_violations:
-        status = "non-compliant"
-    else:
-        status = "compliant"
-    
-    # Build violations list if detailed
-    violation_objects = []
-    if detailed:
-        for v in violations:
-            violation_objects.append(ComplianceViolation(
-                type=v["type"],
-                severity=v["severity"],
-                timestamp=v["timestamp"],
-                description=v.get("description")
-            ))
-    
-    return ComplianceReport(
-        app_id=app_id,
-        compliance_level=level,
-        status=status,
-        last_audit=app_compliance.get("last_event"),
-        events_count=events_count,
-        violations=violation_objects,
-        certificate_url=f"https://pinksync.org/certificates/{app_id}-{level}" if status == "compliant" else None
-    )
+    # An app's report only changes when its event count does, so the count
+    # keys the cached body and stale entries simply age out
+    body = _compliance_report_body(app_id, compliance_event_counts[app_id])
+    return Response(content=body, media_type="application/json")
 
 
 # ============================================================================
@@ -354,8 +792,74 @@ async def get_compliance(
 # Reframed: Dashboard -> Context Initialization
 # ============================================================================
 
-@app.post("/v1/context/initialize", response_model=AccessibilityContext, tags=["Accessibility Context"])
-async def initialize_accessibility_context(request: AccessibilityContextRequest):
+# Compatibility scoring rules, in evaluation order:
+# (preference flag, capability flag, score if supported, score if missing, warning if missing)
+_COMPATIBILITY_RULES = (
+    ("requires_sign_language", "supports_sign_language", 1.0, 0.0,
+     "App does not support sign language but user requires it"),
+    ("requires_captions", "supports_captions", 1.0, 0.0,
+     "App does not support captions but user requires them"),
+    ("visual_only_mode", "supports_visual_only", 1.0, 0.5,
+     "App has limited visual-only mode support"),
+    ("high_contrast", "supports_high_contrast", 1.0, 0.7, None),
+)
+
+_PREFERENCE_FLAGS = tuple(rule[0] for rule in _COMPATIBILITY_RULES)
+_CAPABILITY_FLAGS = tuple(rule[1] for rule in _COMPATIBILITY_RULES)
+
+
+def _flag_bits(model: BaseModel, flags: Tuple[str, ...]) -> int:
+    """Pack the truthiness of `flags` on `model` into a bitmask, one bit per flag."""
+    bits = 0
+    for bit, flag in enumerate(flags):
+        if getattr(model, flag):
+            bits |= 1 << bit
+    return bits
+
+
+def _score_compatibility(pref_bits: int, cap_bits: int) -> Tuple[float, Tuple[str, ...]]:
+    """Average score over the declared preferences, plus warnings for unmet ones."""
+    warnings = []
+    score_total = 0.0
+    score_count = 0
+    for bit, (_, _, supported_score, missing_score, warning) in enumerate(_COMPATIBILITY_RULES):
+        if not pref_bits >> bit & 1:
+            continue
+        score_count += 1
+        if cap_bits >> bit & 1:
+            score_total += supported_score
+        else:
+            score_total += missing_score
+            if warning:
+                warnings.append(warning)
+    return (score_total / score_count if score_count else 0.5), tuple(warnings)
+
+
+# Every (preference bits, capability bits) outcome, so scoring is one lookup
+_COMPATIBILITY_TABLE = {
+    (pref_bits, cap_bits): _score_compatibility(pref_bits, cap_bits)
+    for pref_bits in range(1 << len(_COMPATIBILITY_RULES))
+    for cap_bits in range(1 << len(_COMPATIBILITY_RULES))
+}
+
+# Constraints contributed by each declared preference:
+# (preference flag, required capabilities, recommended capabilities, fallback options, default settings)
+_CONSTRAINT_RULES = (
+    ("requires_captions", ("captions",), (), {},
+     {"caption_enabled": True, "caption_size": "medium"}),
+    ("requires_sign_language", ("sign_language_support",), ("high_quality_video",), {}, {}),
+    ("visual_only_mode", ("visual_indicators",), (),
+     {"audio_content": "text_transcript", "audio_alerts": "visual_alerts"}, {}),
+    ("high_contrast", (), ("theme_customization",), {}, {"contrast_mode": "high"}),
+)
+
+
+@app.post(
+    "/v1/context/initialize",
+    responses={200: {"model": AccessibilityContext}},
+    tags=["Accessibility Context"]
+)
+async def initialize_accessibility_context(request: AccessibilityContextRequest) -> ORJSONResponse:
     """
     Initialize an accessibility context for a consumer app or agent.
     
@@ -375,45 +879,17 @@ async def initialize_accessibility_context(request: AccessibilityContextRequest)
     This context can later be used to validate compliance and track events.
     """
     # Generate context ID
-    context_id = f"ctx_{uuid.uuid4().hex[:12]}"
+    context_id = f"ctx_{_short_hex_id()}"
     
     # Calculate compatibility score
     user_prefs = request.user_preferences
     app_caps = request.app_capabilities
     
-    # Simple compatibility scoring logic
-    score_components = []
-    warnings = []
-    
-    if user_prefs.requires_sign_language:
-        if app_caps.supports_sign_language:
-            score_components.append(1.0)
-        else:
-            score_components.append(0.0)
-            warnings.append("App does not support sign language but user requires it")
-    
-    if user_prefs.requires_captions:
-        if app_caps.supports_captions:
-            score_components.append(1.0)
-        else:
-            score_components.append(0.0)
-            warnings.append("App does not support captions but user requires them")
-    
-    if user_prefs.visual_only_mode:
-        if app_caps.supports_visual_only:
-            score_components.append(1.0)
-        else:
-            score_components.append(0.5)
-            warnings.append("App has limited visual-only mode support")
-    
-    if user_prefs.high_contrast:
-        if app_caps.supports_high_contrast:
-            score_components.append(1.0)
-        else:
-            score_components.append(0.7)
-    
-    # Calculate average score
-    compatibility_score = sum(score_components) / len(score_components) if score_components else 0.5
+    # Compatibility scoring: average score over the preferences the user declared
+    compatibility_score, warnings = _COMPATIBILITY_TABLE[
+        _flag_bits(user_prefs, _PREFERENCE_FLAGS),
+        _flag_bits(app_caps, _CAPABILITY_FLAGS)
+    ]
     
     # Build constraints
     required_caps = []
@@ -421,72 +897,77 @@ async def initialize_accessibility_context(request: AccessibilityContextRequest)
     fallback_options = {}
     default_settings = {}
     
-    if user_prefs.requires_captions:
-        required_caps.append("captions")
-        default_settings["caption_enabled"] = True
-        default_settings["caption_size"] = user_prefs.text_size_preference or "medium"
+    for pref_flag, required, recommended, fallbacks, defaults in _CONSTRAINT_RULES:
+        if getattr(user_prefs, pref_flag):
+            required_caps.extend(required)
+            recommended_caps.extend(recommended)
+            fallback_options.update(fallbacks)
+            default_settings.update(defaults)
     
-    if user_prefs.requires_sign_language:
-        required_caps.append("sign_language_support")
-        recommended_caps.append("high_quality_video")
-    
-    if user_prefs.visual_only_mode:
-        required_caps.append("visual_indicators")
-        fallback_options["audio_content"] = "text_transcript"
-        fallback_options["audio_alerts"] = "visual_alerts"
-    
-    if user_prefs.high_contrast:
-        default_settings["contrast_mode"] = "high"
-        recommended_caps.append("theme_customization")
+    if "caption_size" in default_settings and user_prefs.text_size_preference:
+        default_settings["caption_size"] = user_prefs.text_size_preference
         
-    constraints = ContextConstraints(
+    constraints = ContextConstraints.model_construct(
         required_capabilities=required_caps,
         recommended_capabilities=recommended_caps,
         fallback_options=fallback_options,
         default_settings=default_settings
     )
     
-    return AccessibilityContext(
+    context = AccessibilityContext.model_construct(
         context_id=context_id,
         user_preferences=user_prefs,
         app_capabilities=app_caps,
         constraints=constraints,
         compatibility_score=compatibility_score,
-        warnings=warnings,
-        timestamp=datetime.utcnow().isoformat() + "Z"
+        warnings=list(warnings),
+        timestamp=_utc_timestamp()
     )
+    
+    return ORJSONResponse(context.model_dump())
 
 
 
-# Legacy endpoint for backward compatibility
-@app.post("/api/initialize-dashboard", response_model=DashboardConfig, tags=["Legacy"])
-async def initialize_dashboard(user: UserProfile):
-    """
-    **LEGACY ENDPOINT** - Use `/v1/context/initialize` instead.
-    
-    Initialize a personalized DEAF FIRST dashboard for a user.
-    
-    Creates a customized dashboard based on user profile and needs,
-    with quick access to relevant services and personalized content.
-    """
+# Services recommended for financial goals mentioning each keyword
+_GOAL_KEYWORDS = (
+    ("house", ("Property Search", "Mortgage Guidance")),
+    ("business", ("Business Plan Review",)),
+    ("retire", ("Retirement Planning",)),
+)
+
+
+@lru_cache(maxsize=2048)
+def _dashboard_body(
+    name: str,
+    location: str,
+    needs_financial_help: bool,
+    is_business_owner: bool,
+    needs_healthcare_help: bool,
+    financial_goals: Tuple[str, ...],
+    connected_banks: Tuple[str, ...],
+    insurance_policies: Tuple[str, ...],
+    tax_software: Optional[str],
+    legal_documents: Tuple[str, ...]
+) -> bytes:
+    """Build and encode a dashboard; it depends only on these profile fields, so it is cached."""
     # Build service list based on user needs
     active_services = ["Emergency Text Line", "Visual Chat", "Visual Alerts"]
     
-    if user.needs_financial_help:
+    if needs_financial_help:
         active_services.extend([
             "Visual Tax Prep",
             "Budget Visualizer",
             "Financial Education"
         ])
     
-    if user.is_business_owner:
+    if is_business_owner:
         active_services.extend([
             "Business Plan Review",
             "Business Taxes",
             "Legal Document Review"
         ])
     
-    if user.needs_healthcare_help:
+    if needs_healthcare_help:
         active_services.extend([
             "Appointment Support",
             "Medical Interpreter",
@@ -496,26 +977,22 @@ async def initialize_dashboard(user: UserProfile):
     # Get upcoming deadlines (mock data)
     upcoming_deadlines = ["Q3 Tax Deadline", "Healthcare Renewal"]
     
-    # Get recommended services based on goals
-    recommended = []
-    for goal in user.financial_goals:
+    # Get recommended services based on goals (deduplicated, first-seen order)
+    recommended = {}
+    for goal in financial_goals:
         goal_lower = goal.lower()
-        if "house" in goal_lower:
-            recommended.append("Property Search")
-            recommended.append("Mortgage Guidance")
-        if "business" in goal_lower:
-            recommended.append("Business Plan Review")
-        if "retire" in goal_lower:
-            recommended.append("Retirement Planning")
+        for keyword, services in _GOAL_KEYWORDS:
+            if keyword in goal_lower:
+                recommended.update(dict.fromkeys(services))
     
     # Get local events
     local_events = [
-        f"Deaf Expo - {user.location}",
-        f"Financial Literacy Workshop - {user.location}"
+        f"Deaf Expo - {location}",
+        f"Financial Literacy Workshop - {location}"
     ]
     
-    return DashboardConfig(
-        dashboard_title=f"{user.name}'s DEAF FIRST Dashboard",
+    dashboard = DashboardConfig.model_construct(
+        dashboard_title=f"{name}'s DEAF FIRST Dashboard",
         quick_access=[
             "Emergency Text Line",
             "Financial Advisor Chat",
@@ -529,18 +1006,45 @@ async def initialize_dashboard(user: UserProfile):
             "as_needed": active_services
         },
         personalized_content={
-            "financial_goals": user.financial_goals,
+            "financial_goals": list(financial_goals),
             "upcoming_deadlines": upcoming_deadlines,
-            "recommended_services": list(set(recommended)),
+            "recommended_services": list(recommended),
             "community_events": local_events
         },
         integrations={
-            "bank_accounts": user.connected_banks or [],
-            "insurance_policies": user.insurance_policies or [],
-            "tax_software": user.tax_software,
-            "legal_documents": user.legal_documents or []
+            "bank_accounts": list(connected_banks),
+            "insurance_policies": list(insurance_policies),
+            "tax_software": tax_software,
+            "legal_documents": list(legal_documents)
         }
     )
+    return orjson.dumps(dashboard.model_dump())
+
+
+# Legacy endpoint for backward compatibility
+@app.post("/api/initialize-dashboard", responses={200: {"model": DashboardConfig}}, tags=["Legacy"])
+async def initialize_dashboard(user: UserProfile):
+    """
+    **LEGACY ENDPOINT** - Use `/v1/context/initialize` instead.
+    
+    Initialize a personalized DEAF FIRST dashboard for a user.
+    
+    Creates a customized dashboard based on user profile and needs,
+    with quick access to relevant services and personalized content.
+    """
+    body = _dashboard_body(
+        user.name,
+        user.location,
+        user.needs_financial_help,
+        user.is_business_owner,
+        user.needs_healthcare_help,
+        tuple(user.financial_goals),
+        tuple(user.connected_banks or ()),
+        tuple(user.insurance_policies or ()),
+        user.tax_software,
+        tuple(user.legal_documents or ())
+    )
+    return Response(content=body, media_type="application/json")
 
 
 
@@ -549,15 +1053,187 @@ async def initialize_dashboard(user: UserProfile):
 # Reframed: Service Discovery -> Capability Registry
 # ============================================================================
 
-@app.get("/v1/capabilities", response_model=CapabilityResponse, tags=["Capability Registry"])
+# Mock registry data - in production this would come from a database.
+# Built once at import; catalog entries are trusted, so they skip validation.
+_ALL_CAPABILITIES: Tuple[CapabilityDeclaration, ...] = (
+    CapabilityDeclaration.model_construct(
+        capability_name="sign_language_support",
+        capability_type="visual",
+        description="Support for ASL video communication",
+        parameters={"video_quality": "HD", "latency": "low"},
+        required_features=["video_streaming", "low_latency_mode"]
+    ),
+    CapabilityDeclaration.model_construct(
+        capability_name="live_captions",
+        capability_type="text",
+        description="Real-time caption generation",
+        parameters={"accuracy": "high", "language": "en"},
+        required_features=["speech_to_text", "timing_sync"]
+    ),
+    CapabilityDeclaration.model_construct(
+        capability_name="visual_alerts",
+        capability_type="visual",
+        description="Visual notification system",
+        parameters={"color_customization": True, "pattern_support": True},
+        required_features=["display_api", "notification_system"]
+    ),
+)
+
+_ALL_PROVIDERS: Tuple[ProviderInfo, ...] = (
+    ProviderInfo.model_construct(
+        provider_id="provider_001",
+        provider_name="Visual Communication Service",
+        provider_type="service",
+        capabilities=["sign_language_support", "visual_alerts"],
+        spec_version=SpecVersion.model_construct(version="1.0.0", compliance_level="full"),
+        endpoint="https://api.visual-comm.example/v1",
+        status="active",
+        last_validated="2025-12-20T18:00:00Z"
+    ),
+    ProviderInfo.model_construct(
+        provider_id="provider_002",
+        provider_name="Caption Pro Platform",
+        provider_type="platform",
+        capabilities=["live_captions"],
+        spec_version=SpecVersion.model_construct(version="1.0.0", compliance_level="full"),
+        endpoint="https://api.captionpro.example/v1",
+        status="active",
+        last_validated="2025-12-20T17:30:00Z"
+    ),
+)
+
+# Provider listing entries served by /v1/providers
+_PROVIDER_SUMMARIES: Tuple[Dict[str, Any], ...] = tuple(
+    p.model_dump(include={"provider_id", "provider_name", "provider_type", "capabilities", "status"})
+    for p in _ALL_PROVIDERS
+)
+
+
+def _index_by(items: Iterable[T], keys: Callable[[T], Iterable[str]]) -> Dict[str, Tuple[T, ...]]:
+    """Group items under each key returned by `keys`, preserving catalog order."""
+    index = defaultdict(list)
+    for item in items:
+        for key in keys(item):
+            index[key].append(item)
+    return {key: tuple(group) for key, group in index.items()}
+
+
+def _bitmask_by(items: Iterable[T], keys: Callable[[T], Iterable[str]]) -> Dict[str, int]:
+    """Map each key to a bitmask of the catalog positions whose item carries it."""
+    masks: Dict[str, int] = defaultdict(int)
+    for position, item in enumerate(items):
+        for key in keys(item):
+            masks[key] |= 1 << position
+    return dict(masks)
+
+
+def _select_by_mask(items: Tuple[T, ...], mask: int) -> List[T]:
+    """Return the items at the set bits of `mask`, in catalog order."""
+    selected = []
+    while mask:
+        low_bit = mask & -mask
+        selected.append(items[low_bit.bit_length() - 1])
+        mask ^= low_bit
+    return selected
+
+
+# Lookup indexes so registry filters are dict lookups rather than scans
+_CAPABILITIES_BY_TYPE = _index_by(_ALL_CAPABILITIES, lambda c: (c.capability_type,))
+_PROVIDERS_BY_TYPE = _index_by(_ALL_PROVIDERS, lambda p: (p.provider_type,))
+_PROVIDER_SUMMARIES_BY_STATUS = _index_by(_PROVIDER_SUMMARIES, lambda p: (p["status"],))
+_PROVIDER_SUMMARIES_BY_CAPABILITY = _index_by(_PROVIDER_SUMMARIES, lambda p: p["capabilities"])
+
+# Membership bitmasks over provider positions; combined filters intersect with `&`
+_PROVIDER_STATUS_MASKS = _bitmask_by(_PROVIDER_SUMMARIES, lambda p: (p["status"],))
+_PROVIDER_CAPABILITY_MASKS = _bitmask_by(_PROVIDER_SUMMARIES, lambda p: p["capabilities"])
+
+def _version_key(version: str) -> Tuple[int, int, int]:
+    """
+    Parse a "major.minor.patch" version into an integer tuple for ordering.
+    
+    Missing components count as 0 and any pre-release/build suffix on a
+    component is ignored, so "1.2" == "1.2.0" and "1.10.0" > "1.9.0".
+    """
+    parts = []
+    for part in version.strip().lstrip("vV").split(".")[:3]:
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        parts.append(int(digits) if digits else 0)
+    parts.extend([0] * (3 - len(parts)))
+    return tuple(parts)
+
+
+def _version_sorted(providers: Iterable[ProviderInfo]) -> Tuple[Tuple[ProviderInfo, ...], List[Tuple[int, int, int]]]:
+    """Providers sorted by spec version, with their parsed version keys for bisecting."""
+    ordered = tuple(sorted(providers, key=lambda p: _version_key(p.spec_version.version)))
+    return ordered, [_version_key(p.spec_version.version) for p in ordered]
+
+
+# Providers sorted by spec version, overall (key None) and per provider type,
+# so minimum-version queries, with or without a type filter, are one bisect
+_PROVIDERS_BY_VERSION = {
+    None: _version_sorted(_ALL_PROVIDERS),
+    **{provider_type: _version_sorted(group) for provider_type, group in _PROVIDERS_BY_TYPE.items()}
+}
+
+# Validator for registry responses. It only changes with the catalog contents;
+# it is weak because each response also carries its own query timestamp.
+_REGISTRY_ETAG = 'W/"%s"' % hashlib.sha256(orjson.dumps({
+    "capabilities": [c.model_dump() for c in _ALL_CAPABILITIES],
+    "providers": [p.model_dump() for p in _ALL_PROVIDERS]
+})).hexdigest()[:32]
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against `etag`."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+@lru_cache(maxsize=256)
+def _query_registry(
+    capability_type: Optional[str],
+    provider_type: Optional[str],
+    spec_version: Optional[str]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Filter the registry and dump the matching entries; cached per distinct query."""
+    # Filter capabilities
+    filtered_caps = _CAPABILITIES_BY_TYPE.get(capability_type, ()) if capability_type else _ALL_CAPABILITIES
+    
+    # Filter providers
+    if spec_version:
+        ordered, version_keys = _PROVIDERS_BY_VERSION.get(provider_type or None, ((), []))
+        filtered_providers = ordered[bisect.bisect_left(version_keys, _version_key(spec_version)):]
+    elif provider_type:
+        filtered_providers = _PROVIDERS_BY_TYPE.get(provider_type, ())
+    else:
+        filtered_providers = _ALL_PROVIDERS
+    
+    return (
+        [c.model_dump() for c in filtered_caps],
+        [p.model_dump() for p in filtered_providers]
+    )
+
+
 async def query_capabilities(
     capability_type: Optional[str] = None,
     provider_type: Optional[str] = None,
-    spec_version: Optional[str] = None
-):
+    spec_version: Optional[str] = None,
+    if_none_match: Optional[str] = None
+) -> Response:
     """
     Query the capability registry.
     
+    Served by GET /v1/capabilities (`list_capabilities`) whenever a registry
+    filter is present; the response follows `CapabilityResponse`.
+    
     Answers:
     - What accessibility capabilities exist?
     - Which providers claim support?
@@ -571,85 +1247,30 @@ async def query_capabilities(
     - Spec version compliance
     
     Eventually, service === accessibility-capable provider.
-    """
-    # Build mock capability and provider data
-    capabilities = []
-    providers = []
-    
-    # Mock data - in production this would query a database
-    all_capabilities = [
-        CapabilityDeclaration(
-            capability_name="sign_language_support",
-            capability_type="visual",
-            description="Support for ASL video communication",
-            parameters={"video_quality": "HD", "latency": "low"},
-            required_features=["video_streaming", "low_latency_mode"]
-        ),
-        CapabilityDeclaration(
-            capability_name="live_captions",
-            capability_type="text",
-            description="Real-time caption generation",
-            parameters={"accuracy": "high", "language": "en"},
-            required_features=["speech_to_text", "timing_sync"]
-        ),
-        CapabilityDeclaration(
-            capability_name="visual_alerts",
-            capability_type="visual",
-            description="Visual notification system",
-            parameters={"color_customization": True, "pattern_support": True},
-            required_features=["display_api", "notification_system"]
-        ),
-    ]
     
-    all_providers = [
-        ProviderInfo(
-            provider_id="provider_001",
-            provider_name="Visual Communication Service",
-            provider_type="service",
-            capabilities=["sign_language_support", "visual_alerts"],
-            spec_version=SpecVersion(version="1.0.0", compliance_level="full"),
-            endpoint="https://api.visual-comm.example/v1",
-            status="active",
-            last_validated="2025-12-20T18:00:00Z"
-        ),
-        ProviderInfo(
-            provider_id="provider_002",
-            provider_name="Caption Pro Platform",
-            provider_type="platform",
-            capabilities=["live_captions"],
-            spec_version=SpecVersion(version="1.0.0", compliance_level="full"),
-            endpoint="https://api.captionpro.example/v1",
-            status="active",
-            last_validated="2025-12-20T17:30:00Z"
-        ),
-    ]
+    Responses carry an `ETag`; repeat clients sending `If-None-Match` get a 304.
+    """
+    if _etag_matches(if_none_match, _REGISTRY_ETAG):
+        return Response(status_code=304, headers={"ETag": _REGISTRY_ETAG})
     
-    # Filter capabilities
-    filtered_caps = all_capabilities
-    if capability_type:
-        filtered_caps = [c for c in filtered_caps if c.capability_type == capability_type]
+    capabilities, providers = _query_registry(capability_type, provider_type, spec_version)
     
-    # Filter providers
-    filtered_providers = all_providers
-    if provider_type:
-        filtered_providers = [p for p in filtered_providers if p.provider_type == provider_type]
-    if spec_version:
-        # Simple version string comparison - for production use packaging.version.Version
-        # For now, we accept this limitation as versions follow semantic versioning format
-        filtered_providers = [p for p in filtered_providers if p.spec_version.version == spec_version or p.spec_version.version > spec_version]
-    
-    return CapabilityResponse(
-        capabilities=filtered_caps,
-        providers=filtered_providers,
-        total_count=len(filtered_caps),
-        query_timestamp=datetime.utcnow().isoformat() + "Z"
+    return ORJSONResponse(
+        {
+            "capabilities": capabilities,
+            "providers": providers,
+            "total_count": len(capabilities),
+            "query_timestamp": _utc_timestamp()
+        },
+        headers={"ETag": _REGISTRY_ETAG}
     )
 
 
 @app.get("/v1/providers", tags=["Capability Registry"])
 async def list_providers(
     status: Optional[str] = None,
-    capability: Optional[str] = None
+    capability: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     List all registered accessibility providers.
@@ -660,39 +1281,41 @@ async def list_providers(
     Filter by:
     - Status (active, inactive, deprecated)
     - Specific capability support
+    
+    Responses carry an `ETag`; repeat clients sending `If-None-Match` get a 304.
     """
-    # Mock provider data
-    all_providers = [
-        {
-            "provider_id": "provider_001",
-            "provider_name": "Visual Communication Service",
-            "provider_type": "service",
-            "capabilities": ["sign_language_support", "visual_alerts"],
-            "status": "active"
-        },
+    if _etag_matches(if_none_match, _REGISTRY_ETAG):
+        return Response(status_code=304, headers={"ETag": _REGISTRY_ETAG})
+    
+    if capability and status:
+        mask = _PROVIDER_CAPABILITY_MASKS.get(capability, 0) & _PROVIDER_STATUS_MASKS.get(status, 0)
+        filtered = _select_by_mask(_PROVIDER_SUMMARIES, mask)
+    elif capability:
+        filtered = _PROVIDER_SUMMARIES_BY_CAPABILITY.get(capability, ())
+    elif status:
+        filtered = _PROVIDER_SUMMARIES_BY_STATUS.get(status, ())
+    else:
+        filtered = _PROVIDER_SUMMARIES
+    
+    return ORJSONResponse(
         {
-            "provider_id": "provider_002",
-            "provider_name": "Caption Pro Platform",
-            "provider_type": "platform",
-            "capabilities": ["live_captions"],
-            "status": "active"
+            "providers": list(filtered),
+            "total_count": len(filtered),
+            "timestamp": _utc_timestamp()
         },
-    ]
-    
-    filtered = all_providers
-    if status:
-        filtered = [p for p in filtered if p["status"] == status]
-    if capability:
-        filtered = [p for p in filtered if capability in p["capabilities"]]
-    
-    return {
-        "providers": filtered,
-        "total_count": len(filtered),
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+        headers={"ETag": _REGISTRY_ETAG}
+    )
 
 
 # Legacy service discovery endpoints
+# Body returned when a discovery query matches nothing; it never changes
+_DISCOVERY_NO_MATCH_BYTES = orjson.dumps({
+    "matched_services": [],
+    "message": "No direct match. Try related terms.",
+    "suggestions": list(SERVICE_DISCOVERY_MAP)
+})
+
+
 @app.get("/api/discover", tags=["Legacy"])
 async def discover_services_endpoint(query: str):
     """
@@ -706,17 +1329,25 @@ async def discover_services_endpoint(query: str):
     result = discover_services(query)
     
     if not result["matched_services"] and not result["alternative_services"]:
-        return {
-            "matched_services": [],
-            "message": "No direct match. Try related terms.",
-            "suggestions": list(SERVICE_DISCOVERY_MAP.keys())
-        }
+        return Response(content=_DISCOVERY_NO_MATCH_BYTES, media_type="application/json")
     
-    return result
+    return ORJSONResponse(result)
+
+
+# The legacy service catalog is static, so its bodies are encoded once at import;
+# one ETag covers the catalog and every category drawn from it
+_SERVICES_BYTES = orjson.dumps(pinksync_services.get_all_services())
+_SERVICES_ETAG = 'W/"%s"' % hashlib.sha256(_SERVICES_BYTES).hexdigest()[:32]
+_SERVICES_CACHE_HEADERS = {"Cache-Control": "public, max-age=300", "ETag": _SERVICES_ETAG}
+_SERVICE_CATEGORY_BYTES = {
+    category: orjson.dumps({"category": category, "services": services})
+    for category, services in pinksync_services.get_all_services().items()
+    if services
+}
 
 
 @app.get("/api/services", tags=["Legacy"])
-async def list_all_services():
+async def list_all_services(if_none_match: Optional[str] = Header(None)):
     """
     **LEGACY ENDPOINT** - Use `/v1/providers` or `/v1/capabilities` instead.
     
@@ -724,11 +1355,13 @@ async def list_all_services():
     
     Returns the complete service catalog organized by category.
     """
-    return pinksync_services.get_all_services()
+    if _etag_matches(if_none_match, _SERVICES_ETAG):
+        return Response(status_code=304, headers=_SERVICES_CACHE_HEADERS)
+    return Response(content=_SERVICES_BYTES, media_type="application/json", headers=_SERVICES_CACHE_HEADERS)
 
 
 @app.get("/api/services/{category}", tags=["Legacy"])
-async def get_service_category(category: str):
+async def get_service_category(category: str, if_none_match: Optional[str] = Header(None)):
     """
     **LEGACY ENDPOINT** - Use `/v1/capabilities` with filters instead.
     
@@ -744,18 +1377,17 @@ async def get_service_category(category: str):
     - emergency
     - business
     """
-    services = pinksync_services.get_service_category(category)
+    body = _SERVICE_CATEGORY_BYTES.get(category)
     
-    if not services:
+    if body is None:
         raise HTTPException(
             status_code=404,
             detail=f"Category '{category}' not found. Available categories: communication, financial, accessibility, education, professional, community, emergency, business"
         )
     
-    return {
-        "category": category,
-        "services": services
-    }
+    if _etag_matches(if_none_match, _SERVICES_ETAG):
+        return Response(status_code=304, headers=_SERVICES_CACHE_HEADERS)
+    return Response(content=body, media_type="application/json", headers=_SERVICES_CACHE_HEADERS)
 
 
 # ============================================================================
@@ -763,12 +1395,16 @@ async def get_service_category(category: str):
 # Enhanced: Machine-readable compliance results
 # ============================================================================
 
-@app.post("/v1/validate", response_model=ValidationReport, tags=["Validation & Compliance"])
+@app.post(
+    "/v1/validate",
+    responses={200: {"model": ValidationReport}},
+    tags=["Validation & Compliance"]
+)
 async def validate_target(
     target_url: str,
     spec_version: str = "1.0.0",
     detailed: bool = True
-):
+) -> ORJSONResponse:
     """
     Validate a target for accessibility compliance.
     
@@ -785,17 +1421,47 @@ async def validate_target(
     
     This is infrastructure gravity.
     """
-    # Generate report ID
-    report_id = f"report_{uuid.uuid4().hex[:12]}"
-    
+    report = await _build_validation_report(
+        target_url, spec_version, detailed, _utc_timestamp(), f"report_{_short_hex_id()}"
+    )
+    return ORJSONResponse(report)
+
+
+# Score contributed by each compliance status; unknown statuses score 0
+_STATUS_SCORES = {"pass": 1.0, "partial": 0.5, "fail": 0.0, "unknown": 0.0}
+
+
+def _score_results(results: Iterable[ComplianceResultOut]) -> Tuple[float, float]:
+    """Return the mean status score and mean confidence in a single pass."""
+    status_score = _STATUS_SCORES.get
+    count = 0
+    score_total = 0.0
+    confidence_total = 0.0
+    for result in results:
+        count += 1
+        score_total += status_score(result.status, 0.0)
+        confidence_total += result.confidence
+    if not count:
+        return 0.0, 0.0
+    return score_total / count, confidence_total / count
+
+
+async def _build_validation_report(
+    target_url: str,
+    spec_version: str,
+    detailed: bool,
+    timestamp: str,
+    report_id: str
+) -> ValidationReportOut:
+    """Run the compliance checks for a single target and build its report."""
     # Use existing validation logic
-    basic_result = validate_url(target_url)
+    basic_result = await _validate_url_async(target_url)
     
-    # Build compliance results
+    # Build compliance results (server-generated, so plain response structs suffice)
     results = {}
     
     # Sign language support check
-    results["sign_language_support"] = ComplianceResult(
+    results["sign_language_support"] = ComplianceResultOut(
         check_name="sign_language_support",
         status="partial" if basic_result.get("asl_compatible") else "fail",
         confidence=0.85,
@@ -804,7 +1470,7 @@ async def validate_target(
     )
     
     # Captions check
-    results["captions"] = ComplianceResult(
+    results["captions"] = ComplianceResultOut(
         check_name="captions",
         status="pass",
         confidence=0.95,
@@ -813,7 +1479,7 @@ async def validate_target(
     )
     
     # Visual-only mode check
-    results["visual_only_mode"] = ComplianceResult(
+    results["visual_only_mode"] = ComplianceResultOut(
         check_name="visual_only_mode",
         status="fail" if basic_result.get("audio_issues_found") else "pass",
         confidence=0.90,
@@ -821,58 +1487,96 @@ async def validate_target(
         evidence=["audio_required"] if basic_result.get("audio_issues_found") else []
     )
     
-    # Calculate overall score
-    status_scores = {"pass": 1.0, "partial": 0.5, "fail": 0.0, "unknown": 0.0}
-    scores = [status_scores.get(r.status, 0.0) for r in results.values()]
-    overall_score = sum(scores) / len(scores) if scores else 0.0
-    
-    # Calculate overall confidence
-    confidences = [r.confidence for r in results.values()]
-    overall_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    overall_score, overall_confidence = _score_results(results.values())
     
-    return ValidationReport(
+    return ValidationReportOut(
         report_id=report_id,
-        target=ValidationTarget(
+        target=ValidationTargetOut(
             target_type="url",
             target_identifier=target_url,
-            metadata={"validated_at": datetime.utcnow().isoformat() + "Z"}
+            metadata={"validated_at": timestamp}
         ),
         spec_version=spec_version,
         results=results,
         overall_score=overall_score,
         confidence=overall_confidence,
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=timestamp,
         validator_version="1.0.0"
     )
 
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _stream_validation_reports(
+    urls: List[str],
+    report_ids: List[str],
+    spec_version: str,
+    timestamp: str
+) -> AsyncIterator[bytes]:
+    """Yield each batch report as an NDJSON line as soon as its checks finish."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+    
+    async def _run(url: str, hex_id: str) -> ValidationReportOut:
+        async with semaphore:
+            return await _build_validation_report(
+                url, spec_version, detailed=False, timestamp=timestamp, report_id=f"report_{hex_id}"
+            )
+    
+    tasks = [asyncio.ensure_future(_run(url, hex_id)) for url, hex_id in zip(urls, report_ids)]
+    try:
+        for next_report in asyncio.as_completed(tasks):
+            yield orjson.dumps(await next_report) + b"\n"
+    finally:
+        # Client went away mid-stream: stop validating the remaining targets
+        for task in tasks:
+            task.cancel()
+
+
 @app.post("/v1/validate/batch", tags=["Validation & Compliance"])
 async def validate_batch_targets(
     urls: List[str],
-    spec_version: str = "1.0.0"
+    spec_version: str = "1.0.0",
+    accept: Optional[str] = Header(None)
 ):
     """
     Batch validate multiple targets for accessibility compliance.
     
     Returns machine-readable compliance results for multiple targets.
+    
+    Send `Accept: application/x-ndjson` to stream one report per line,
+    in completion order, instead of waiting for the whole batch.
     """
-    reports = []
-    for url in urls:
-        report = await validate_target(url, spec_version, detailed=False)
-        reports.append(report)
+    # One timestamp for the whole batch
+    timestamp = _utc_timestamp()
+    report_ids = _short_hex_ids(len(urls))
+    
+    if accept and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(
+            _stream_validation_reports(urls, report_ids, spec_version, timestamp),
+            media_type=NDJSON_MEDIA_TYPE
+        )
     
-    return {
+    reports = await _gather_bounded(
+        _build_validation_report(
+            url, spec_version, detailed=False, timestamp=timestamp, report_id=f"report_{hex_id}"
+        )
+        for url, hex_id in zip(urls, report_ids)
+    )
+    
+    return ORJSONResponse({
         "status": "success",
         "reports": reports,
         "total_validated": len(reports),
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+        "timestamp": timestamp
+    })
 
 
 # Legacy validation endpoints
-@app.post("/api/py/ai-validate", response_model=ValidationResponse, tags=["Legacy"])
+@app.post("/api/py/ai-validate", responses={200: {"model": ValidationResponse}}, tags=["Legacy"])
 async def ai_validate(
     request: ValidationRequest,
+    background_tasks: BackgroundTasks,
     x_magician_role: Optional[str] = Header(None, alias="X-Magician-Role")
 ):
     """
@@ -887,28 +1591,34 @@ async def ai_validate(
     """
     # Optional: Validate agent role
     if x_magician_role and x_magician_role != "accessibility-auditor":
-        logger.warning(f"Unauthorized agent role: {x_magician_role}")
+        logger.warning("Unauthorized agent role: %s", x_magician_role)
     
     if not request.urls:
         raise HTTPException(status_code=400, detail="No URLs provided")
     
+    validated = await _gather_bounded(_validate_url_async(url) for url in request.urls)
+    
     results = []
-    for url in request.urls:
-        result = validate_url(url)
+    scores = []
+    for url, result in zip(request.urls, validated):
         score = result.get("deaf_score", 0)
         asl_compatible = result.get("asl_compatible", False)
         
-        # Send score to Fibonrose
-        await send_score(url, score, asl_compatible)
+        # Collect score for Fibonrose; all scores are sent in one request after responding
+        scores.append({"url": url, "score": score, "asl_compatible": asl_compatible})
         
-        results.append(ValidationResult(
+        results.append(ValidationResult.model_construct(
             url=url,
             deaf_score=score,
             asl_compatible=asl_compatible,
             audio_issues_found=result.get("audio_issues_found", False)
         ))
     
-    return ValidationResponse(status="success", results=results)
+    # Without the lifespan (no shared client) scores are only logged
+    background_tasks.add_task(send_scores_batch, scores, client=getattr(app.state, "http", None))
+    
+    response = ValidationResponse.model_construct(status="success", results=results)
+    return ORJSONResponse(response.model_dump())
 
 
 @app.post("/api/validate", tags=["Legacy"])
@@ -918,8 +1628,8 @@ async def validate_single_url(url: str):
     
     Validate a single URL for deaf accessibility.
     """
-    result = validate_url(url)
-    return result
+    result = await _validate_url_async(url)
+    return ORJSONResponse(result)
 
 
 # ============================================================================
@@ -941,12 +1651,12 @@ async def report_discrepancy(report: DiscrepancyReport):
     
     This helps refine validation accuracy and improve the accessibility signal layer.
     """
-    return {
+    return ORJSONResponse({
         "status": "accepted",
         "report_id": report.report_id,
         "message": "Discrepancy report received and queued for analysis",
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+        "timestamp": _utc_timestamp()
+    })
 
 
 @app.post("/v1/feedback/false-positive", tags=["Signal Correction"])
@@ -959,13 +1669,13 @@ async def report_false_positive(report: FalsePositiveReport):
     
     False positive reports help improve validation accuracy over time.
     """
-    return {
+    return ORJSONResponse({
         "status": "accepted",
         "report_id": report.report_id,
         "validation_report_id": report.validation_report_id,
         "message": "False positive report received and queued for review",
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+        "timestamp": _utc_timestamp()
+    })
 
 
 @app.post("/v1/feedback/mismatch", tags=["Signal Correction"])
@@ -976,12 +1686,12 @@ async def report_user_mismatch(report: UserMismatchReport):
     When what the system thinks is happening differs from what
     the user actually experiences, this provides critical signal correction.
     """
-    return {
+    return ORJSONResponse({
         "status": "accepted",
         "report_id": report.report_id,
         "message": "Mismatch report received and queued for analysis",
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+        "timestamp": _utc_timestamp()
+    })
 
 
 # Legacy feedback endpoint
@@ -994,7 +1704,7 @@ async def collect_feedback(service_used: str, feedback: UserExperience):
     
     Helps improve services and ensures they remain DEAF FIRST.
     """
-    return {
+    return ORJSONResponse({
         "message": "Feedback received",
         "service": service_used,
         "summary": {
@@ -1005,13 +1715,15 @@ async def collect_feedback(service_used: str, feedback: UserExperience):
             "would_recommend": feedback.would_recommend,
             "alternatives_needed": feedback.alternatives_needed
         }
-    }
+    })
 
 
 # ============================================================================
 # Accessibility Events Endpoint (v1) - THE HEART OF PINKSYNC
 # ============================================================================
 
+# Shadowed: accept_event (Broker v1) registers POST /v1/events first and serves
+# every request to it; this handler only contributes to the OpenAPI document
 @app.post("/v1/events", response_model=EventResponse, tags=["Accessibility Events"])
 async def submit_accessibility_event(event: AccessibilityEvent):
     """
@@ -1038,7 +1750,7 @@ async def submit_accessibility_event(event: AccessibilityEvent):
     # In production, this would persist to a database or event stream
     # For now, we accept and acknowledge the event
     
-    logger.info(f"Accessibility event received: {event.event_type} from {event.source}")
+    logger.info("Accessibility event received: %s from %s", event.event_type, event.source)
     
     return EventResponse(
         status="success",
@@ -1046,11 +1758,36 @@ async def submit_accessibility_event(event: AccessibilityEvent):
         rejected_count=0,
         event_ids=[event.event_id],
         errors=[],
-        timestamp=datetime.utcnow().isoformat() + "Z"
+        timestamp=_utc_timestamp()
     )
 
 
-@app.post("/v1/events/batch", response_model=EventResponse, tags=["Accessibility Events"])
+def _partition_events(
+    events: Iterable[AccessibilityEvent]
+) -> Tuple[List[str], List[str], List[Dict[str, str]]]:
+    """Split events into accepted IDs, rejected IDs and per-event rejection errors."""
+    accepted: List[str] = []
+    rejected: List[str] = []
+    errors: List[Dict[str, str]] = []
+    
+    for event in events:
+        # Validate event structure
+        if event.event_id and event.event_type and event.source:
+            accepted.append(event.event_id)
+            continue
+        
+        # Use a fallback ID for rejected events without IDs
+        rejected_id = event.event_id or f"unknown_{len(rejected)}"
+        rejected.append(rejected_id)
+        errors.append({
+            "event_id": rejected_id,
+            "error": "Missing required fields"
+        })
+    
+    return accepted, rejected, errors
+
+
+@app.post("/v1/events/batch", responses={200: {"model": EventResponse}}, tags=["Accessibility Events"])
 async def submit_accessibility_events_batch(batch: EventBatch):
     """
     Submit a batch of accessibility events.
@@ -1060,45 +1797,34 @@ async def submit_accessibility_events_batch(batch: EventBatch):
     
     Events are the append-only log that makes PinkSync auditable and accountable.
     """
-    accepted = []
-    rejected = []
-    errors = []
-    
-    for event in batch.events:
-        try:
-            # Validate event structure
-            event_id = getattr(event, 'event_id', None)
-            if not event_id or not event.event_type or not event.source:
-                # Use a fallback ID for rejected events without IDs
-                rejected_id = event_id if event_id else f"unknown_{len(rejected)}"
-                rejected.append(rejected_id)
-                errors.append({
-                    "event_id": rejected_id,
-                    "error": "Missing required fields"
-                })
-                continue
-            
-            # In production, persist to event store
-            logger.info(f"Batch event received: {event.event_type} from {event.source}")
-            accepted.append(event_id)
-            
-        except Exception as e:
-            # Handle case where event might not have event_id
-            event_id = getattr(event, 'event_id', f"error_{len(rejected)}")
-            rejected.append(event_id)
-            errors.append({
-                "event_id": event.event_id,
-                "error": str(e)
-            })
+    accepted, rejected, errors = _partition_events(batch.events)
     
-    return EventResponse(
+    # In production, persist accepted events to the event store
+    logger.info("Batch %s received: %d accepted, %d rejected", batch.batch_id, len(accepted), len(rejected))
+    
+    response = EventResponse.model_construct(
         status="success" if len(accepted) > 0 else "error",
         accepted_count=len(accepted),
         rejected_count=len(rejected),
         event_ids=accepted,
         errors=errors,
-        timestamp=datetime.utcnow().isoformat() + "Z"
+        timestamp=_utc_timestamp()
     )
+    return ORJSONResponse(response.model_dump())
+
+
+# The event taxonomy is static; only the timestamp is spliced in per request
+_EVENT_TYPES_BODY_PREFIX = orjson.dumps({
+    "event_types": [
+        {
+            "type": event_type.value,
+            "category": event_type.value.split('.')[0],
+            "description": f"Event: {event_type.value}"
+        }
+        for event_type in EventType
+    ],
+    "total_count": len(EventType)
+})[:-1] + b',"timestamp":'
 
 
 @app.get("/v1/events/types", tags=["Accessibility Events"])
@@ -1108,53 +1834,234 @@ async def list_event_types():
     
     Returns the complete taxonomy of events that PinkSync accepts.
     """
-    return {
-        "event_types": [
-            {
-                "type": event_type.value,
-                "category": event_type.value.split('.')[0],
-                "description": f"Event: {event_type.value}"
-            }
-            for event_type in EventType
-        ],
-        "total_count": len(EventType),
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+    return Response(
+        content=_EVENT_TYPES_BODY_PREFIX + orjson.dumps(_utc_timestamp()) + b"}",
+        media_type="application/json"
+    )
 
 
 # ============================================================================
 # Health Check Endpoints
 # ============================================================================
 
+# Static meta responses, encoded once at import
+_STATIC_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "PinkSync API"})
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "PinkSync API"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+_ROOT_BODY = orjson.dumps({
+    "name": "PinkSync API - Accessibility Signal Exchange",
+    "version": "1.0.0",
+    "description": "Deaf-First Protocol Infrastructure",
+    "tagline": "Not a Deaf app. A Deaf-first protocol.",
+    "api_versions": {
+        "v1": "/v1",
+        "legacy": "/api"
+    },
+    "docs": "/docs",
+    "health": "/health",
+    "core_capabilities": [
+        "Accessibility context initialization",
+        "Capability registry and discovery",
+        "Machine-readable compliance validation",
+        "Real-time accessibility event streaming",
+        "Signal correction and feedback"
+    ],
+    "endpoints": "/api/endpoints"
+})
 
 
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with API information."""
-    return {
-        "name": "PinkSync API - Accessibility Signal Exchange",
-        "version": "1.0.0",
-        "description": "Deaf-First Protocol Infrastructure",
-        "tagline": "Not a Deaf app. A Deaf-first protocol.",
-        "api_versions": {
-            "v1": "/v1",
-            "legacy": "/api"
-        },
-        "docs": "/docs",
-        "health": "/health",
-        "core_capabilities": [
-            "Accessibility context initialization",
-            "Capability registry and discovery",
-            "Machine-readable compliance validation",
-            "Real-time accessibility event streaming",
-            "Signal correction and feedback"
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+_ENDPOINTS_BODY = orjson.dumps({
+    "broker_v1": {
+        "description": "Core accessibility event broker - Contract-first API",
+        "endpoints": [
+            {
+                "path": "/v1/events",
+                "method": "POST",
+                "description": "Accept accessibility events from applications",
+                "status": "available",
+                "contract": "/specs/event-broker.contract.md"
+            },
+            {
+                "path": "/v1/capabilities",
+                "method": "GET",
+                "description": "List registered application capabilities",
+                "status": "available",
+                "contract": "/specs/event-broker.contract.md"
+            },
+            {
+                "path": "/v1/subscribe",
+                "method": "POST",
+                "description": "Subscribe to accessibility events",
+                "status": "available",
+                "contract": "/specs/event-broker.contract.md"
+            },
+            {
+                "path": "/v1/compliance/{app_id}",
+                "method": "GET",
+                "description": "Check compliance status for an application",
+                "status": "available",
+                "contract": "/specs/event-broker.contract.md"
+            }
+        ]
+    },
+    "dashboard": {
+        "description": "Personalized DEAF FIRST dashboard services",
+        "endpoints": [
+            {
+                "path": "/api/initialize-dashboard",
+                "method": "POST",
+                "description": "Initialize personalized dashboard",
+                "status": "available"
+            }
+        ]
+    },
+    "discovery": {
+        "description": "Service discovery and search",
+        "endpoints": [
+            {
+                "path": "/api/discover",
+                "method": "GET",
+                "description": "Discover services based on query",
+                "status": "available"
+            },
+            {
+                "path": "/api/services",
+                "method": "GET",
+                "description": "List all available services",
+                "status": "available"
+            },
+            {
+                "path": "/api/services/{category}",
+                "method": "GET",
+                "description": "Get services by category",
+                "status": "available"
+            }
+        ]
+    },
+    "validation": {
+        "description": "Accessibility validation services",
+        "endpoints": [
+            {
+                "path": "/api/py/ai-validate",
+                "method": "POST",
+                "description": "AI batch validation for deaf accessibility",
+                "status": "available"
+            },
+            {
+                "path": "/api/validate",
+                "method": "POST",
+                "description": "Validate single URL",
+                "status": "available"
+            }
+        ]
+    },
+    "feedback": {
+        "description": "Service feedback collection",
+        "endpoints": [
+            {
+                "path": "/api/feedback",
+                "method": "POST",
+                "description": "Collect service feedback",
+                "status": "available"
+            }
+        ]
+    },
+    "ecosystem": {
+        "description": "PinkSync ecosystem integration",
+        "endpoints": [
+            {
+                "path": "/api/ecosystem/features",
+                "method": "GET",
+                "description": "Discover available features from pinkycollie/pinksync repository",
+                "status": "available"
+            },
+            {
+                "path": "/api/ecosystem/source",
+                "method": "GET",
+                "description": "Get source repository information",
+                "status": "available"
+            }
+        ]
+    },
+    "system": {
+        "description": "System health and information",
+        "endpoints": [
+            {
+                "path": "/",
+                "method": "GET",
+                "description": "Root endpoint with API information",
+                "status": "available"
+            },
+            {
+                "path": "/health",
+                "method": "GET",
+                "description": "Health check endpoint",
+                "status": "available"
+            },
+            {
+                "path": "/api/endpoints",
+                "method": "GET",
+                "description": "List all available endpoints (this endpoint)",
+                "status": "available"
+            },
+            {
+                "path": "/docs",
+                "method": "GET",
+                "description": "Interactive API documentation",
+                "status": "available"
+            },
+            {
+                "path": "/redoc",
+                "method": "GET",
+                "description": "Alternative API documentation",
+                "status": "available"
+            },
+            {
+                "path": "/openapi.json",
+                "method": "GET",
+                "description": "OpenAPI schema",
+                "status": "available"
+            }
+        ]
+    },
+    "promise": {
+        "message": "This is our PROMISE - every endpoint listed here is available and working",
+        "contract": "All broker endpoints follow the contract defined in /specs/event-broker.contract.md",
+        "compliance": "All endpoints support deaf-first accessibility principles",
+        "source": "Additional features and microservices available at github.com/pinkycollie/pinksync"
+    },
+    "roadmap": {
+        "planned": [
+            {
+                "path": "/v1/events/stream",
+                "method": "GET",
+                "description": "Real-time event streaming via WebSocket",
+                "status": "planned",
+                "eta": "Q1 2026"
+            },
+            {
+                "path": "/v1/analytics",
+                "method": "GET",
+                "description": "Accessibility analytics dashboard",
+                "status": "planned",
+                "eta": "Q2 2026"
+            }
         ]
-        "endpoints": "/api/endpoints"
     }
+})
 
 
 @app.get("/api/endpoints", tags=["Root"])
@@ -1165,185 +2072,34 @@ async def list_all_endpoints():
     Showcases the PATH - all accessible endpoints organized by category.
     This is your PROMISE of what PinkSync delivers.
     """
-    return {
-        "broker_v1": {
-            "description": "Core accessibility event broker - Contract-first API",
-            "endpoints": [
-                {
-                    "path": "/v1/events",
-                    "method": "POST",
-                    "description": "Accept accessibility events from applications",
-                    "status": "available",
-                    "contract": "/specs/event-broker.contract.md"
-                },
-                {
-                    "path": "/v1/capabilities",
-                    "method": "GET",
-                    "description": "List registered application capabilities",
-                    "status": "available",
-                    "contract": "/specs/event-broker.contract.md"
-                },
-                {
-                    "path": "/v1/subscribe",
-                    "method": "POST",
-                    "description": "Subscribe to accessibility events",
-                    "status": "available",
-                    "contract": "/specs/event-broker.contract.md"
-                },
-                {
-                    "path": "/v1/compliance/{app_id}",
-                    "method": "GET",
-                    "description": "Check compliance status for an application",
-                    "status": "available",
-                    "contract": "/specs/event-broker.contract.md"
-                }
-            ]
-        },
-        "dashboard": {
-            "description": "Personalized DEAF FIRST dashboard services",
-            "endpoints": [
-                {
-                    "path": "/api/initialize-dashboard",
-                    "method": "POST",
-                    "description": "Initialize personalized dashboard",
-                    "status": "available"
-                }
-            ]
-        },
-        "discovery": {
-            "description": "Service discovery and search",
-            "endpoints": [
-                {
-                    "path": "/api/discover",
-                    "method": "GET",
-                    "description": "Discover services based on query",
-                    "status": "available"
-                },
-                {
-                    "path": "/api/services",
-                    "method": "GET",
-                    "description": "List all available services",
-                    "status": "available"
-                },
-                {
-                    "path": "/api/services/{category}",
-                    "method": "GET",
-                    "description": "Get services by category",
-                    "status": "available"
-                }
-            ]
-        },
-        "validation": {
-            "description": "Accessibility validation services",
-            "endpoints": [
-                {
-                    "path": "/api/py/ai-validate",
-                    "method": "POST",
-                    "description": "AI batch validation for deaf accessibility",
-                    "status": "available"
-                },
-                {
-                    "path": "/api/validate",
-                    "method": "POST",
-                    "description": "Validate single URL",
-                    "status": "available"
-                }
-            ]
-        },
-        "feedback": {
-            "description": "Service feedback collection",
-            "endpoints": [
-                {
-                    "path": "/api/feedback",
-                    "method": "POST",
-                    "description": "Collect service feedback",
-                    "status": "available"
-                }
-            ]
-        },
-        "ecosystem": {
-            "description": "PinkSync ecosystem integration",
-            "endpoints": [
-                {
-                    "path": "/api/ecosystem/features",
-                    "method": "GET",
-                    "description": "Discover available features from pinkycollie/pinksync repository",
-                    "status": "available"
-                },
-                {
-                    "path": "/api/ecosystem/source",
-                    "method": "GET",
-                    "description": "Get source repository information",
-                    "status": "available"
-                }
-            ]
-        },
-        "system": {
-            "description": "System health and information",
-            "endpoints": [
-                {
-                    "path": "/",
-                    "method": "GET",
-                    "description": "Root endpoint with API information",
-                    "status": "available"
-                },
-                {
-                    "path": "/health",
-                    "method": "GET",
-                    "description": "Health check endpoint",
-                    "status": "available"
-                },
-                {
-                    "path": "/api/endpoints",
-                    "method": "GET",
-                    "description": "List all available endpoints (this endpoint)",
-                    "status": "available"
-                },
-                {
-                    "path": "/docs",
-                    "method": "GET",
-                    "description": "Interactive API documentation",
-                    "status": "available"
-                },
-                {
-                    "path": "/redoc",
-                    "method": "GET",
-                    "description": "Alternative API documentation",
-                    "status": "available"
-                },
-                {
-                    "path": "/openapi.json",
-                    "method": "GET",
-                    "description": "OpenAPI schema",
-                    "status": "available"
-                }
-            ]
-        },
-        "promise": {
-            "message": "This is our PROMISE - every endpoint listed here is available and working",
-            "contract": "All broker endpoints follow the contract defined in /specs/event-broker.contract.md",
-            "compliance": "All endpoints support deaf-first accessibility principles",
-            "source": "Additional features and microservices available at github.com/pinkycollie/pinksync"
-        },
-        "roadmap": {
-            "planned": [
-                {
-                    "path": "/v1/events/stream",
-                    "method": "GET",
-                    "description": "Real-time event streaming via WebSocket",
-                    "status": "planned",
-                    "eta": "Q1 2026"
-                },
-                {
-                    "path": "/v1/analytics",
-                    "method": "GET",
-                    "description": "Accessibility analytics dashboard",
-                    "status": "planned",
-                    "eta": "Q2 2026"
-                }
-            ]
-        }
+    return Response(content=_ENDPOINTS_BODY, media_type="application/json", headers=_STATIC_CACHE_HEADERS)
+
+
+_ECOSYSTEM_SOURCE_BODY = orjson.dumps({
+    "repository": "github.com/pinkycollie/pinksync",
+    "url": "https://github.com/pinkycollie/pinksync",
+    "description": "Source repository containing all PinkSync features, tools, and microservices",
+    "structure": {
+        "features": "Feature branches with specific accessibility capabilities",
+        "tools": "Specialized tools for accessibility testing and validation",
+        "microservices": "Independent microservices extending PinkSync functionality"
+    },
+    "integration": {
+        "contracts": "All features must follow contracts defined in /specs",
+        "broker": "All services emit events to PinkSync broker",
+        "compliance": "All components respect compliance levels"
+    },
+    "documentation": {
+        "ecosystem_guide": "/ECOSYSTEM.md",
+        "specifications": "/specs/README.md",
+        "core_principles": "/Core.md"
+    },
+    "deployment": {
+        "monorepo": "Deploy all features together",
+        "selective": "Deploy specific feature branches",
+        "microservices": "Deploy each service independently"
     }
+})
 
 
 @app.get("/api/ecosystem/source", tags=["Ecosystem"])
@@ -1354,31 +2110,62 @@ async def get_source_repository():
     Returns details about the pinkycollie/pinksync repository where all features,
     tools, and microservices are developed.
     """
-    return {
-        "repository": "github.com/pinkycollie/pinksync",
-        "url": "https://github.com/pinkycollie/pinksync",
-        "description": "Source repository containing all PinkSync features, tools, and microservices",
-        "structure": {
-            "features": "Feature branches with specific accessibility capabilities",
-            "tools": "Specialized tools for accessibility testing and validation",
-            "microservices": "Independent microservices extending PinkSync functionality"
-        },
-        "integration": {
-            "contracts": "All features must follow contracts defined in /specs",
-            "broker": "All services emit events to PinkSync broker",
-            "compliance": "All components respect compliance levels"
-        },
-        "documentation": {
-            "ecosystem_guide": "/ECOSYSTEM.md",
-            "specifications": "/specs/README.md",
-            "core_principles": "/Core.md"
-        },
-        "deployment": {
-            "monorepo": "Deploy all features together",
-            "selective": "Deploy specific feature branches",
-            "microservices": "Deploy each service independently"
-        }
-    }
+    return Response(content=_ECOSYSTEM_SOURCE_BODY, media_type="application/json", headers=_STATIC_CACHE_HEADERS)
+
+
+_ECOSYSTEM_FEATURES_BODY = orjson.dumps({
+    "source_repository": "github.com/pinkycollie/pinksync",
+    "features": {
+        "available": [
+            {
+                "name": "Sign Language Interpreter",
+                "branch": "feature/sign-language-interpreter",
+                "description": "ASL video interpretation service",
+                "status": "check repository for availability"
+            },
+            {
+                "name": "Visual Alerts",
+                "branch": "feature/visual-alerts",
+                "description": "Convert audio alerts to visual notifications",
+                "status": "check repository for availability"
+            },
+            {
+                "name": "Caption Generator",
+                "branch": "microservice/caption-generator",
+                "description": "Real-time caption generation microservice",
+                "status": "check repository for availability"
+            },
+            {
+                "name": "ASL Video Processor",
+                "branch": "microservice/asl-video-processor",
+                "description": "Video processing optimized for sign language",
+                "status": "check repository for availability"
+            }
+        ]
+    },
+    "tools": {
+        "available": [
+            {
+                "name": "Accessibility Validator",
+                "branch": "tool/accessibility-validator",
+                "description": "Validate applications against PinkSync contracts",
+                "status": "check repository for availability"
+            },
+            {
+                "name": "Compliance Checker",
+                "branch": "tool/compliance-checker",
+                "description": "Check compliance level of applications",
+                "status": "check repository for availability"
+            }
+        ]
+    },
+    "how_to_use": {
+        "discover": "Visit https://github.com/pinkycollie/pinksync to see all available branches",
+        "checkout": "git clone -b <branch-name> https://github.com/pinkycollie/pinksync",
+        "integrate": "Follow the README.md in each branch for integration instructions"
+    },
+    "note": "Feature availability and branches are maintained in the source repository. Check github.com/pinkycollie/pinksync for the most current list of available features, tools, and microservices."
+})
 
 
 @app.get("/api/ecosystem/features", tags=["Ecosystem"])
@@ -1389,106 +2176,4 @@ async def discover_ecosystem_features():
     Lists features, tools, and microservices available in the pinkycollie/pinksync
     repository. These are organized by branches in the source repository.
     """
-    return {
-        "source_repository": "github.com/pinkycollie/pinksync",
-        "features": {
-            "available": [
-                {
-                    "name": "Sign Language Interpreter",
-                    "branch": "feature/sign-language-interpreter",
-                    "description": "ASL video interpretation service",
-                    "status": "check repository for availability"
-                },
-                {
-                    "name": "Visual Alerts",
-                    "branch": "feature/visual-alerts",
-                    "description": "Convert audio alerts to visual notifications",
-                    "status": "check repository for availability"
-                },
-                {
-                    "name": "Caption Generator",
-                    "branch": "microservice/caption-generator",
-                    "description": "Real-time caption generation microservice",
-                    "status": "check repository for availability"
-                },
-                {
-                    "name": "ASL Video Processor",
-                    "branch": "microservice/asl-video-processor",
-                    "description": "Video processing optimized for sign language",
-                    "status": "check repository for availability"
-                }
-            ]
-        },
-        "tools": {
-            "available": [
-                {
-                    "name": "Accessibility Validator",
-                    "branch": "tool/accessibility-validator",
-                    "description": "Validate applications against PinkSync contracts",
-                    "status": "check repository for availability"
-                },
-                {
-                    "name": "Compliance Checker",
-                    "branch": "tool/compliance-checker",
-                    "description": "Check compliance level of applications",
-                    "status": "check repository for availability"
-                }
-            ]
-        },
-        "how_to_use": {
-            "discover": "Visit https://github.com/pinkycollie/pinksync to see all available branches",
-            "checkout": "git clone -b <branch-name> https://github.com/pinkycollie/pinksync",
-            "integrate": "Follow the README.md in each branch for integration instructions"
-        },
-        "note": "Feature availability and branches are maintained in the source repository. Check github.com/pinkycollie/pinksync for the most current list of available features, tools, and microservices."
-    }
-
-
-# OpenAPI tags metadata
-tags_metadata = [
-    {
-        "name": "Accessibility Context",
-        "description": "Initialize accessibility contexts - handshake between app capabilities and user preferences"
-    },
-    {
-        "name": "Capability Registry",
-        "description": "Discover accessibility capabilities and providers. Query which providers support specific features."
-        "name": "Broker v1",
-        "description": "PinkSync Accessibility Event Broker - Core API for accessibility intent brokering. Contract-first, type-safe, async-native. See specs/event-broker.contract.md for full contract."
-    },
-    {
-        "name": "Ecosystem",
-        "description": "Discover features, tools, and microservices from github.com/pinkycollie/pinksync source repository"
-    },
-    {
-        "name": "Dashboard",
-        "description": "Initialize personalized Deaf-First dashboard"
-    },
-    {
-        "name": "Validation & Compliance",
-        "description": "Machine-readable compliance validation. Results can block deployments, unlock badges, or satisfy regulators."
-    },
-    {
-        "name": "Accessibility Events",
-        "description": "Real-time event stream. Append-only, structured, auditable. The heart of PinkSync."
-    },
-    {
-        "name": "Signal Correction",
-        "description": "Report discrepancies, false positives, and mismatches. Signal correction, not opinions."
-    },
-    {
-        "name": "Legacy",
-        "description": "Legacy endpoints for backward compatibility. Use versioned /v1 endpoints instead."
-    },
-    {
-        "name": "Health",
-        "description": "Health check and status endpoints"
-        "description": "Health check endpoints"
-    },
-    {
-        "name": "Root",
-        "description": "Root endpoints and API information"
-    }
-]
-
-app.openapi_tags = tags_metadata
+    return Response(content=_ECOSYSTEM_FEATURES_BODY, media_type="application/json", headers=_STATIC_CACHE_HEADERS)
@@ -37,6 +37,9 @@ class ValidationRequest(BaseModel):
     
     task: str = Field("validate_batch", description="Validation task type")
     urls: List[str] = Field(default_factory=list, description="URLs to validate")
+    
+    class Config:
+        frozen = True
 
 
 class ValidationResult(BaseModel):
@@ -20,6 +20,7 @@ class UserProfile(BaseModel):
     legal_documents: Optional[List[str]] = Field(default_factory=list, description="Legal documents")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "name": "Maria",
@@ -44,6 +45,7 @@ class UserExperience(BaseModel):
     alternatives_needed: Optional[str] = Field("", description="Alternative services needed")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "rating": 5,
@@ -19,8 +19,11 @@ from .capabilities import (
 )
 from .compliance import (
     ComplianceResult,
+    ComplianceResultOut,
     ValidationReport,
+    ValidationReportOut,
     ValidationTarget,
+    ValidationTargetOut,
     SignedValidationReport
 )
 from .events import (
@@ -51,8 +54,11 @@ __all__ = [
     "SpecVersion",
     # Compliance
     "ComplianceResult",
+    "ComplianceResultOut",
     "ValidationReport",
+    "ValidationReportOut",
     "ValidationTarget",
+    "ValidationTargetOut",
     "SignedValidationReport",
     # Events
     "AccessibilityEvent",
@@ -19,6 +19,7 @@ class AccessibilityPreferences(BaseModel):
     color_blindness_type: Optional[str] = Field(None, description="Type of color blindness if applicable")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "requires_sign_language": True,
@@ -46,6 +47,7 @@ class AppCapabilities(BaseModel):
     spec_version: str = Field("1.0.0", description="Accessibility spec version compliance")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "app_name": "MyDeafApp",
@@ -94,6 +96,7 @@ class AccessibilityContextRequest(BaseModel):
     context_type: str = Field("standard", description="Type of context (standard, emergency, educational, etc.)")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "user_preferences": {
@@ -3,6 +3,7 @@ Compliance and Validation Schemas
 Schemas for machine-readable compliance results and validation reports
 """
 
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 
@@ -94,6 +95,44 @@ class ValidationReport(BaseModel):
         }
 
 
+# Response-path mirrors of the models above. Reports are built server-side and
+# never need coercion, so these skip Pydantic entirely; orjson encodes
+# dataclasses natively without an intermediate model_dump() walk.
+
+@dataclass(frozen=True, slots=True)
+class ValidationTargetOut:
+    """Validation target as emitted in a report."""
+    
+    target_type: str
+    target_identifier: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class ComplianceResultOut:
+    """Compliance check result as emitted in a report."""
+    
+    check_name: str
+    status: str
+    confidence: float
+    details: Optional[str] = None
+    evidence: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationReportOut:
+    """Validation report as emitted by the validation endpoints."""
+    
+    report_id: str
+    target: ValidationTargetOut
+    spec_version: str
+    results: Dict[str, ComplianceResultOut]
+    overall_score: float
+    confidence: float
+    timestamp: str
+    validator_version: str
+
+
 class SignedValidationReport(BaseModel):
     """Cryptographically signed validation report."""
     
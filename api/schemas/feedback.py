@@ -21,6 +21,7 @@ class DiscrepancyReport(BaseModel):
     evidence: Optional[List[str]] = Field(default_factory=list, description="Evidence (screenshots, logs, etc.)")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "report_id": "disc_abc123",
@@ -49,6 +50,7 @@ class FalsePositiveReport(BaseModel):
     reporter_id: Optional[str] = Field(None, description="ID of the reporter")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "report_id": "fp_abc123",
@@ -76,6 +78,7 @@ class UserMismatchReport(BaseModel):
     user_id: Optional[str] = Field(None, description="ID of the user")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "report_id": "mismatch_abc123",
@@ -246,21 +246,28 @@ SERVICE_DISCOVERY_MAP = {
 }
 
 
+# Words of each discovery key, split once for alternative matching
+_DISCOVERY_KEY_WORDS = [(key.split(), services) for key, services in SERVICE_DISCOVERY_MAP.items()]
+MAX_ALTERNATIVE_SERVICES = 5
+
+
 def discover_services(query: str) -> dict:
     """Discover services based on user query."""
     query_lower = query.lower()
     
     matched = SERVICE_DISCOVERY_MAP.get(query_lower, [])
     
-    # Find alternative services if no exact match
+    # Find alternative services if no exact match, stopping once there are enough
     alternatives = []
     if not matched:
-        for key, services in SERVICE_DISCOVERY_MAP.items():
-            if any(word in query_lower for word in key.split()):
+        for words, services in _DISCOVERY_KEY_WORDS:
+            if any(word in query_lower for word in words):
                 alternatives.extend(services)
+                if len(alternatives) >= MAX_ALTERNATIVE_SERVICES:
+                    break
     
     return {
         "matched_services": matched,
-        "alternative_services": alternatives[:5],  # Limit to 5 alternatives
+        "alternative_services": alternatives[:MAX_ALTERNATIVE_SERVICES],
         "community_recommendations": []  # Placeholder for community recommendations
     }
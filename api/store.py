@@ -0,0 +1,45 @@
+"""
+PinkSync Broker Storage
+In-memory, append-only event log for the accessibility event broker
+"""
+
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import sys
+
+
+class EventLog:
+    """
+    Append-only, column-oriented log of accepted accessibility events.
+
+    Each field is kept in its own column instead of one dict per event:
+    repeated app IDs, intents and compliance levels are interned, processing
+    times are stored as int64 nanoseconds, and signatures as raw digest bytes.
+    """
+
+    def __init__(self) -> None:
+        self.event_ids: List[str] = []
+        self.app_ids: List[str] = []
+        self.user_ids: List[Optional[str]] = []
+        self.intents: List[str] = []
+        self.timestamps: List[datetime] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self.compliance_levels: List[Optional[str]] = []
+        self.processed_at_ns = array("q")
+        self.signatures: List[bytes] = []
+
+    def __len__(self) -> int:
+        return len(self.event_ids)
+
+    def append(self, event_id: str, event: Any, processed_at_ns: int, signature: str) -> None:
+        """Store an accepted event and its hex signature."""
+        self.event_ids.append(event_id)
+        self.app_ids.append(sys.intern(event.app_id))
+        self.user_ids.append(event.user_id)
+        self.intents.append(sys.intern(event.intent))
+        self.timestamps.append(event.timestamp)
+        self.metadata.append(event.metadata)
+        self.compliance_levels.append(event.compliance_level and sys.intern(event.compliance_level))
+        self.processed_at_ns.append(processed_at_ns)
+        self.signatures.append(bytes.fromhex(signature))
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+PinkSync API In-Process Test
+
+Exercises the API through FastAPI's TestClient, without a running server
+or the application lifespan.
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient
+
+from api import main as api
+from api.validators import validate_url
+
+
+# Not used as a context manager, so the lifespan (shared HTTP client,
+# event writer) never runs
+client = TestClient(api.app)
+
+
+def _validate_async(url):
+    """Run _validate_url_async to completion."""
+    return asyncio.run(api._validate_url_async(url))
+
+
+def test_validate_url_async_matches_validate_url():
+    """Test cached async validation returns validate_url's verdict for the raw URL."""
+    print("Testing async URL validation against validate_url...")
+
+    urls = [
+        "https://example.com",
+        "https://EXAMPLE.com/",
+        "https://deaf.example.com/path/",
+        "https://exa\tmple.com",
+        "https://example.com/\n",
+        "https://example.com/#top",
+        "https://example.com#top",
+        "not a url",
+        "ftp://example.com",
+        "https://exämple.com",
+    ]
+    api._validation_cache.clear()
+    for url in urls:
+        # Twice: once to fill the cache, once served from it
+        for _ in range(2):
+            result = _validate_async(url)
+            expected = validate_url(url)
+            assert result == expected, f"{url!r}: {result} != {expected}"
+
+    print(f"✓ {len(urls)} URLs validated identically, cold and cached")
+
+
+def test_equivalent_urls_share_cache_entry():
+    """Test host case and bare trailing slashes fold into one cache key."""
+    print("\nTesting cache key normalization...")
+
+    assert api._normalize_url("https://EXAMPLE.com/") == api._normalize_url("https://example.com")
+    assert api._normalize_url("HTTPS://Example.com/a/") == "https://example.com/a"
+
+    # The slash is kept before a query or fragment, where validate_url needs it
+    assert api._normalize_url("https://example.com/#top") != api._normalize_url("https://example.com#top")
+    assert api._normalize_url("https://example.com/?q=1") == "https://example.com/?q=1"
+
+    # URLs urlsplit would rewrite keep a key of their own
+    assert api._normalize_url("https://exa\tmple.com") == "https://exa\tmple.com"
+    assert api._normalize_url("https://example.com?") == "https://example.com?"
+    print("✓ Equivalent URLs share a key; rewritten URLs do not")
+
+
+def test_ai_validate_without_lifespan():
+    """Test legacy AI validation succeeds when no shared HTTP client exists."""
+    print("\nTesting ai-validate without the lifespan...")
+
+    assert getattr(api.app.state, "http", None) is None
+    response = client.post(
+        "/api/py/ai-validate",
+        json={"urls": ["https://deaf.example.com", "not a url"]},
+        headers={"X-Magician-Role": "accessibility-auditor"}
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["status"] == "success"
+    assert [r["deaf_score"] for r in data["results"]] == [95, 0]
+    print("✓ ai-validate returned 200 with scores")
+
+
+def test_capabilities_route_ownership():
+    """Test GET /v1/capabilities serves both the broker list and registry queries."""
+    print("\nTesting GET /v1/capabilities...")
+
+    response = client.get("/v1/capabilities")
+    assert response.status_code == 200
+    data = response.json()
+    assert "capabilities" in data
+    assert "total" in data
+
+    response = client.get("/v1/capabilities", params={"capability_type": "visual"})
+    assert response.status_code == 200
+    data = response.json()
+    assert "providers" in data
+    etag = response.headers["etag"]
+
+    response = client.get(
+        "/v1/capabilities",
+        params={"capability_type": "visual"},
+        headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    # Broker and registry filters select different responses, so mixing them is rejected
+    response = client.get("/v1/capabilities", params={"app_id": "x", "capability_type": "visual"})
+    assert response.status_code == 400
+    print("✓ Broker list and registry query both served, with ETag revalidation")
+
+
+def test_events_route_ownership():
+    """Test POST /v1/events is served by the broker's accept_event."""
+    print("\nTesting POST /v1/events...")
+
+    owners = [
+        route.endpoint.__name__
+        for route in api.app.routes
+        if getattr(route, "path", None) == "/v1/events" and "POST" in route.methods
+    ]
+    assert owners[0] == "accept_event", owners
+
+    event = {
+        "app_id": "api-test-app",
+        "intent": "visual_only",
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+    response = client.post("/v1/events", json=event)
+    assert response.status_code == 201, response.text
+    data = response.json()
+    assert data["status"] == "accepted"
+    assert "event_id" in data
+    assert "signature" in data
+    print(f"✓ Event accepted by accept_event: {data['event_id']}")
+
+
+def test_malformed_event_body():
+    """Test hand-parsed event bodies fail with FastAPI's own 422 errors."""
+    print("\nTesting malformed POST /v1/events bodies...")
+
+    headers = {"Content-Type": "application/json"}
+    response = client.post("/v1/events", content=b'{"app_id": ', headers=headers)
+    assert response.status_code == 422
+    assert response.json()["detail"] == [{
+        "type": "json_invalid",
+        "loc": ["body", 11],
+        "msg": "JSON decode error",
+        "input": {},
+        "ctx": {"error": "Expecting value"}
+    }]
+
+    response = client.post("/v1/events", content=b"", headers=headers)
+    assert response.status_code == 422
+    assert response.json()["detail"] == [
+        {"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}
+    ]
+
+    response = client.post("/v1/events", content=b"\xff", headers=headers)
+    assert response.status_code == 400
+    print("✓ Malformed, empty and undecodable bodies match FastAPI's errors")
+
+
+def test_batch_validation_ndjson():
+    """Test batch validation streams one NDJSON report per target when asked."""
+    print("\nTesting NDJSON batch validation...")
+
+    urls = ["https://a.example.com", "https://deaf.example.com", "not a url"]
+    response = client.post(
+        "/v1/validate/batch",
+        json=urls,
+        headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.content.splitlines()
+    assert len(lines) == len(urls)
+    streamed = [json.loads(line) for line in lines]
+
+    # Lines arrive in completion order, so compare by target
+    response = client.post("/v1/validate/batch", json=urls)
+    assert response.status_code == 200
+    buffered = response.json()["reports"]
+    def by_target(reports):
+        return {r["target"]["target_identifier"]: (r["overall_score"], r["results"]) for r in reports}
+
+    assert by_target(streamed) == by_target(buffered)
+    assert len({r["report_id"] for r in streamed}) == len(urls)
+    print(f"✓ {len(lines)} NDJSON reports match the buffered response")
+
+
+def test_full_event_queue_keeps_order():
+    """Test events arriving at a full writer queue are persisted in acceptance order."""
+    print("\nTesting the full-queue inline drain...")
+
+    # A tiny queue with no writer task: the third event finds it full
+    api.app.state.event_queue = asyncio.Queue(maxsize=2)
+    try:
+        start = len(api.events_store)
+        accepted = []
+        for _ in range(3):
+            event = {
+                "app_id": "api-test-queue",
+                "intent": "visual_only",
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            }
+            response = client.post("/v1/events", json=event)
+            assert response.status_code == 201, response.text
+            accepted.append(response.json()["event_id"])
+    finally:
+        del api.app.state.event_queue
+
+    # The queued backlog is flushed before the inline write, never after
+    assert api.events_store.event_ids[start:] == accepted
+    print("✓ Backlog flushed ahead of the inline write, order kept")
+
+
+def test_providers_revalidation():
+    """Test /v1/providers answers a matching If-None-Match with 304."""
+    print("\nTesting /v1/providers revalidation...")
+
+    response = client.get("/v1/providers")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get("/v1/providers", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = client.get("/v1/providers", headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200
+    print("✓ Matching ETag gets 304, stale ETag gets the body")
+
+
+def test_service_category_revalidation():
+    """Test service categories share the catalog ETag and answer it with 304."""
+    print("\nTesting /api/services/{category} revalidation...")
+
+    response = client.get("/api/services/emergency")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=300"
+    etag = response.headers["etag"]
+    assert client.get("/api/services").headers["etag"] == etag
+
+    response = client.get("/api/services/emergency", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Unknown categories are still a 404, whatever the client has cached
+    response = client.get("/api/services/nope", headers={"If-None-Match": etag})
+    assert response.status_code == 404
+    print("✓ Category responses revalidate against the catalog ETag")
+
+
+def test_compliance_report_follows_event_count():
+    """Test the cached compliance report moves with the event count and level thresholds."""
+    print("\nTesting compliance report caching across level thresholds...")
+
+    app_id = "api-test-compliance"
+    expected_levels = {1: "bronze", 9: "bronze", 49: "bronze", 50: "silver", 199: "silver", 200: "gold"}
+    for count in range(1, 201):
+        event = {
+            "app_id": app_id,
+            "intent": "visual_only",
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }
+        assert client.post("/v1/events", json=event).status_code == 201
+        if count not in expected_levels:
+            continue
+
+        # Fetched twice so the second read comes from the cached body
+        for _ in range(2):
+            response = client.get(f"/v1/compliance/{app_id}")
+            assert response.status_code == 200
+            report = response.json()
+            assert report["events_count"] == count, report
+            assert report["compliance_level"] == expected_levels[count], report
+            assert report["certificate_url"].endswith(f"{app_id}-{expected_levels[count]}")
+            assert report["status"] == "compliant"
+            assert report["violations"] == []
+
+    print("✓ Report tracked bronze, silver and gold as events arrived")
+
+
+def main():
+    print("PinkSync API In-Process Test")
+    print("=" * 60)
+
+    try:
+        test_validate_url_async_matches_validate_url()
+        test_equivalent_urls_share_cache_entry()
+        test_ai_validate_without_lifespan()
+        test_capabilities_route_ownership()
+        test_events_route_ownership()
+        test_malformed_event_body()
+        test_batch_validation_ndjson()
+        test_full_event_queue_keeps_order()
+        test_providers_revalidation()
+        test_service_category_revalidation()
+        test_compliance_report_follows_event_count()
+
+        print("\n" + "=" * 60)
+        print("All tests passed! ✓")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        return 1
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())